@@ -5,41 +5,58 @@ Flask web application for serving hotel reservation predictions.
 
 This module:
 1) Instantiates a Flask app and loads the trained model artifact.
-2) Exposes a single route ('/') which renders a simple form and, on POST,
+2) Exposes a route ('/') which renders a simple form and, on POST,
    parses user inputs, performs prediction, and returns the result to the template.
+3) Exposes a JSON route ('/predict_batch') that scores many rows in one call.
 
 Usage
 -----
 Run locally (development):
     python app.py
 
+Run in production (gevent workers, model loaded once pre-fork):
+    gunicorn -c gunicorn.conf.py app:app
+
 Then open the app in your browser:
     http://127.0.0.1:8080
 
 Notes
 -----
-- The model artefact path is configured via `config.paths_config.MODEL_OUTPUT_PATH`.
+- The model artefact path is configured via `config.paths_config.MODEL_OUTPUT_PATH`;
+  until a text model has been trained, the legacy pickle at `LEGACY_MODEL_PATH`
+  is loaded instead (with a warning).
+- The artefact is LightGBM's native text model, loaded straight into a Booster;
+  with gunicorn's `--preload` it is parsed once and shared copy-on-write
+  between workers instead of duplicated per process.
+- Predictions run on the backend named by the `INFERENCE_BACKEND` env var
+  ("numba" by default, then "onnx", then "lightgbm"); a backend that is
+  unavailable (Numba or ONNX Runtime missing, no current ONNX export) falls
+  through to the next.
 - Errors are logged using the project-wide logger and surfaced cleanly.
-- Input parsing is intentionally explicit to mirror the expected form fields
-  and preserve the model's feature ordering.
+- Form fields are declared once in `_FORM_FIELDS`, arranged into
+  `_FORM_SCHEMA` in the trained model's feature order, and parsed in a
+  single pass per request.
 """
 
 # -------------------------------------------------------------------
 # Standard Library Imports
 # -------------------------------------------------------------------
-from typing import Callable, Optional, Any
+import os
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Any, Tuple
 
 # -------------------------------------------------------------------
 # Third-Party Imports
 # -------------------------------------------------------------------
-import joblib
+import lightgbm as lgb
 import numpy as np
-from flask import Flask, render_template, request
+from flask import Flask, jsonify, render_template, request
 
 # -------------------------------------------------------------------
 # Internal Imports
 # -------------------------------------------------------------------
-from config.paths_config import MODEL_OUTPUT_PATH
+from config.paths_config import MODEL_OUTPUT_PATH, ONNX_MODEL_OUTPUT_PATH, LEGACY_MODEL_PATH
 from src.logger import get_logger
 from src.custom_exception import CustomException
 
@@ -52,19 +69,25 @@ logger = get_logger(__name__)
 # -------------------------------------------------------------------
 # Model Loading
 # -------------------------------------------------------------------
-def _load_model(model_path: str) -> Any:
+def _load_model(model_path: str, legacy_path: str) -> Tuple[lgb.Booster, str]:
     """
-    Load a serialised model artefact using joblib.
+    Load the trained model from LightGBM's native text format.
+
+    When no text model exists yet (e.g. a fresh checkout that has not been
+    retrained), the legacy joblib pickle is loaded instead and its Booster
+    is used.
 
     Parameters
     ----------
     model_path : str
         Filesystem path to the trained model artefact.
+    legacy_path : str
+        Filesystem path to the pickled `LGBMClassifier` fallback.
 
     Returns
     -------
-    Any
-        The loaded model object.
+    Tuple[lgb.Booster, str]
+        The loaded booster and the path it was read from.
 
     Raises
     ------
@@ -72,18 +95,299 @@ def _load_model(model_path: str) -> Any:
         If the model cannot be loaded for any reason.
     """
     try:
+        if not os.path.exists(model_path) and os.path.exists(legacy_path):
+            logger.warning(
+                f"No model at '{model_path}'; falling back to the legacy pickle '{legacy_path}'."
+            )
+            import joblib
+
+            model = joblib.load(legacy_path).booster_
+            logger.info("Model loaded successfully.")
+            return model, legacy_path
+
         logger.info(f"Loading model artefact from: {model_path}")
-        model = joblib.load(model_path)
+        model = lgb.Booster(model_file=model_path)
         logger.info("Model loaded successfully.")
-        return model
+        return model, model_path
     except Exception as e:
         logger.error(f"Failed to load model from '{model_path}': {e}")
-        import sys
-        raise CustomException("Unable to load the trained model artefact.", sys) from e
+        raise CustomException("Unable to load the trained model artefact.") from e
+
+
+# Load once at import time for performance. Predicting through the Booster
+# skips the sklearn wrapper's per-call input validation, which dominates at
+# batch size 1.
+booster, MODEL_PATH = _load_model(MODEL_OUTPUT_PATH, LEGACY_MODEL_PATH)
+
+# One OpenMP thread per call so concurrent workers don't oversubscribe cores.
+# The feature count is checked once against the schema below, so the
+# per-call shape check is disabled.
+_PREDICT_PARAMS = {"num_threads": 1, "predict_disable_shape_check": True}
+
+# The binary booster returns P(class 1); this matches the wrapper's argmax.
+DECISION_THRESHOLD: float = 0.5
+
+
+# -------------------------------------------------------------------
+# Inference Backend
+# -------------------------------------------------------------------
+def _load_onnx_session(onnx_path: str, model_path: str) -> Optional[Any]:
+    """
+    Open the ONNX export of the model with ONNX Runtime, if it is usable.
+
+    Parameters
+    ----------
+    onnx_path : str
+        Filesystem path to the exported ONNX artefact.
+    model_path : str
+        Filesystem path to the primary model artefact; an ONNX file older
+        than this is treated as stale.
+
+    Returns
+    -------
+    Optional[onnxruntime.InferenceSession]
+        A single-threaded CPU session, or None when ONNX Runtime is not
+        installed or no current export exists.
+
+    Raises
+    ------
+    CustomException
+        If the ONNX artefact exists but cannot be loaded.
+    """
+    # Imported here so a missing or broken onnxruntime only disables this backend
+    try:
+        import onnxruntime as ort
+    except (ImportError, OSError) as e:
+        logger.warning(f"ONNX backend unavailable: {e}")
+        return None
+    if not os.path.exists(onnx_path) or os.path.getmtime(onnx_path) < os.path.getmtime(model_path):
+        logger.warning(f"No current ONNX artefact at '{onnx_path}'; using the LightGBM Booster.")
+        return None
+    try:
+        logger.info(f"Loading ONNX artefact from: {onnx_path}")
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        options.log_severity_level = 3
+        session = ort.InferenceSession(
+            onnx_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        logger.info("ONNX Runtime session created successfully.")
+        return session
+    except Exception as e:
+        logger.error(f"Failed to load ONNX model from '{onnx_path}': {e}")
+        raise CustomException("Unable to load the ONNX model artefact.") from e
+
+
+def _numba_predictor() -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """
+    Build the Numba tree-walker backend from the loaded booster.
+
+    Returns
+    -------
+    Optional[Callable[[np.ndarray], np.ndarray]]
+        The predictor, or None if Numba is missing or the model is unsupported.
+    """
+    try:
+        from src.lgbm_to_arrays import booster_to_arrays, predict_proba as ensemble_proba
+
+        ensemble = booster_to_arrays(booster)
+        # Compile (or load the cached) kernel now rather than on the first request
+        ensemble_proba(np.zeros((1, booster.num_feature()), dtype=np.float32), ensemble)
+    except (ImportError, ValueError) as e:
+        logger.warning(f"Numba backend unavailable: {e}")
+        return None
+
+    def predict_proba(features: np.ndarray) -> np.ndarray:
+        return ensemble_proba(features, ensemble)
+
+    return predict_proba
+
+
+def _onnx_predictor() -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """
+    Build the ONNX Runtime backend from the exported ONNX artefact.
+
+    Returns
+    -------
+    Optional[Callable[[np.ndarray], np.ndarray]]
+        The predictor, or None if no current ONNX export exists.
+    """
+    session = _load_onnx_session(ONNX_MODEL_OUTPUT_PATH, MODEL_PATH)
+    if session is None:
+        return None
+    input_name = session.get_inputs()[0].name
+
+    def predict_proba(features: np.ndarray) -> np.ndarray:
+        return session.run(["probabilities"], {input_name: features})[0][:, 1]
+
+    return predict_proba
+
+
+def _booster_predictor() -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build the plain LightGBM Booster backend (always available).
+
+    Returns
+    -------
+    Callable[[np.ndarray], np.ndarray]
+        The predictor.
+    """
+    def predict_proba(features: np.ndarray) -> np.ndarray:
+        return booster.predict(features, **_PREDICT_PARAMS)
+
+    return predict_proba
+
+
+# Backends from fastest to most portable; `INFERENCE_BACKEND` picks the
+# starting point and unavailable backends fall through to the next one.
+_BACKENDS: Tuple[Tuple[str, Callable[[], Optional[Callable[[np.ndarray], np.ndarray]]]], ...] = (
+    ("numba", _numba_predictor),
+    ("onnx", _onnx_predictor),
+    ("lightgbm", _booster_predictor),
+)
+INFERENCE_BACKEND: str = os.environ.get("INFERENCE_BACKEND", "numba")
+
+
+def _build_predictor(preferred: str) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Select the preferred backend for class-1 probabilities, with fallback.
+
+    Parameters
+    ----------
+    preferred : str
+        One of "numba", "onnx" or "lightgbm".
+
+    Returns
+    -------
+    Callable[[np.ndarray], np.ndarray]
+        Maps an (n, N_FEATURES) float32 array to an (n,) array of P(class 1).
 
+    Raises
+    ------
+    ValueError
+        If `preferred` is not a known backend.
+    """
+    names = [name for name, _ in _BACKENDS]
+    if preferred not in names:
+        raise ValueError(f"Unknown INFERENCE_BACKEND '{preferred}'; expected one of {names}")
+
+    for name, builder in _BACKENDS[names.index(preferred):]:
+        predictor = builder()
+        if predictor is not None:
+            logger.info(f"Serving predictions with the '{name}' backend.")
+            return predictor
+
+
+predict_proba = _build_predictor(INFERENCE_BACKEND)
+
+
+# -------------------------------------------------------------------
+# Feature Schema & Buffer
+# -------------------------------------------------------------------
+# Form field name and caster for each model feature the UI collects.
+_FORM_FIELDS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "lead_time": ("lead_time", int),
+    "no_of_special_requests": ("no_of_special_request", int),
+    "avg_price_per_room": ("avg_price_per_room", float),
+    "arrival_month": ("arrival_month", int),
+    "arrival_date": ("arrival_date", int),
+    "market_segment_type": ("market_segment_type", int),
+    "no_of_week_nights": ("no_of_week_nights", int),
+    "no_of_weekend_nights": ("no_of_weekend_nights", int),
+    "type_of_meal_plan": ("type_of_meal_plan", int),
+    "room_type_reserved": ("room_type_reserved", int),
+}
+
+# Feature selection orders columns by importance, so the input order is
+# taken from the trained model rather than hard-coded here.
+FEATURE_NAMES: Tuple[str, ...] = tuple(booster.feature_name())
+_missing = [name for name in FEATURE_NAMES if name not in _FORM_FIELDS]
+if _missing:
+    raise ValueError(f"Model expects features with no form field: {_missing}")
+
+_FORM_SCHEMA: Tuple[Tuple[str, Callable[[str], Any]], ...] = tuple(
+    _FORM_FIELDS[name] for name in FEATURE_NAMES
+)
+
+N_FEATURES: int = len(_FORM_SCHEMA)
+_FEATURE_SET = frozenset(FEATURE_NAMES)
+MAX_BATCH_ROWS: int = 10_000                # Upper bound per /predict_batch call
+MAX_REQUEST_BYTES: int = 8 << 20            # Bodies past this get a 413 before parsing
+app.config["MAX_CONTENT_LENGTH"] = MAX_REQUEST_BYTES
+
+_buffers = threading.local()
+
+
+def _feature_buffer() -> np.ndarray:
+    """
+    Return this thread's reusable (1, N_FEATURES) float32 input row.
 
-# Load once at import time for performance
-loaded_model = _load_model(MODEL_OUTPUT_PATH)
+    Requests write their features into the buffer in place, so the hot path
+    allocates no new arrays. Greenlets sharing a thread never yield between
+    filling the buffer and calling the model, so one buffer per thread is safe.
+
+    Returns
+    -------
+    np.ndarray
+        A C-contiguous float32 array of shape (1, N_FEATURES).
+    """
+    buf = getattr(_buffers, "row", None)
+    if buf is None:
+        buf = _buffers.row = np.empty((1, N_FEATURES), dtype=np.float32, order="C")
+    return buf
+
+
+# -------------------------------------------------------------------
+# Prediction Cache
+# -------------------------------------------------------------------
+@lru_cache(maxsize=4096)
+def _cached_predict(feat_tuple: Tuple[float, ...]) -> int:
+    """
+    Predict a single booking, memoised on its cast feature values.
+
+    Identical form submissions are answered from an in-process LRU cache
+    instead of re-traversing the boosted trees. `functools.lru_cache` keeps
+    its bookkeeping consistent under threaded and gevent workers.
+
+    Parameters
+    ----------
+    feat_tuple : Tuple[float, ...]
+        Feature values in the model's expected order.
+
+    Returns
+    -------
+    int
+        Predicted class label (0 = cancel, 1 = not cancel).
+    """
+    features = _feature_buffer()
+    features[0, :] = feat_tuple
+    return int(predict_proba(features)[0] > DECISION_THRESHOLD)
+
+
+# -------------------------------------------------------------------
+# Warm-up
+# -------------------------------------------------------------------
+def warm_up() -> None:
+    """
+    Run one throwaway prediction so first-request costs are paid at boot.
+
+    This allocates the calling thread's feature buffer, spins up LightGBM's
+    thread pool and faults in the model pages. Called at import (once in the
+    gunicorn master under `preload_app`) and again from the `post_fork` hook
+    so each worker starts warm. Failures are logged rather than raised.
+    """
+    try:
+        features = _feature_buffer()
+        features.fill(0.0)
+        predict_proba(features)
+        booster.predict(features, **_PREDICT_PARAMS)
+        logger.info("Model warm-up completed.")
+    except Exception as e:
+        logger.warning(f"Model warm-up failed: {e}")
+
+
+warm_up()
 
 
 # -------------------------------------------------------------------
@@ -130,6 +434,33 @@ def _parse_field(
         raise ValueError(f"Invalid value for '{form_key}': {raw} ({e})") from e
 
 
+def _parse_form() -> Tuple[float, ...]:
+    """
+    Cast every field in `_FORM_SCHEMA` from `request.form` in a single pass.
+
+    The fast path does one lookup and one cast per field. Only when that
+    fails are the fields re-parsed with `_parse_field`, so the raised error
+    names the offending input.
+
+    Returns
+    -------
+    Tuple[float, ...]
+        Feature values in the model's expected order.
+
+    Raises
+    ------
+    ValueError
+        If a field is missing, blank, or cannot be cast.
+    """
+    field = request.form.__getitem__
+    try:
+        return tuple([cast(field(key)) for key, cast in _FORM_SCHEMA])
+    except (KeyError, ValueError):
+        for key, cast in _FORM_SCHEMA:
+            _parse_field(key, cast)
+        raise
+
+
 # -------------------------------------------------------------------
 # Routes
 # -------------------------------------------------------------------
@@ -158,59 +489,26 @@ def index():
     if request.method == "POST":
         try:
             # -----------------------------------------------------------
-            # 1) Extract and cast inputs from the form
-            #    Keep the order aligned with the model's expected features.
+            # 1) Extract and cast inputs in the model's order (hashable key)
             # -----------------------------------------------------------
-            lead_time: int = _parse_field("lead_time", int)
-            no_of_special_request: int = _parse_field("no_of_special_request", int)
-            avg_price_per_room: float = _parse_field("avg_price_per_room", float)
-            arrival_month: int = _parse_field("arrival_month", int)
-            arrival_date: int = _parse_field("arrival_date", int)
-
-            market_segment_type: int = _parse_field("market_segment_type", int)
-            no_of_week_nights: int = _parse_field("no_of_week_nights", int)
-            no_of_weekend_nights: int = _parse_field("no_of_weekend_nights", int)
+            feat_tuple: Tuple[float, ...] = _parse_form()
 
-            type_of_meal_plan: int = _parse_field("type_of_meal_plan", int)
-            room_type_reserved: int = _parse_field("room_type_reserved", int)
+            logger.info("Received features for prediction: %s", feat_tuple)
 
             # -----------------------------------------------------------
-            # 2) Construct the feature array with the exact shape (1, 10)
+            # 2) Predict (served from the LRU cache on repeat inputs)
             # -----------------------------------------------------------
-            features: np.ndarray = np.array(
-                [
-                    [
-                        lead_time,
-                        no_of_special_request,
-                        avg_price_per_room,
-                        arrival_month,
-                        arrival_date,
-                        market_segment_type,
-                        no_of_week_nights,
-                        no_of_weekend_nights,
-                        type_of_meal_plan,
-                        room_type_reserved,
-                    ]
-                ],
-                dtype=float,  # cast to float to be universally acceptable for most models
-            )
-
-            logger.info(f"Received features for prediction: {features.tolist()}")
+            prediction = _cached_predict(feat_tuple)
+            logger.info("Model prediction: %s", prediction)
 
             # -----------------------------------------------------------
-            # 3) Predict
+            # 3) Render result
             # -----------------------------------------------------------
-            prediction = loaded_model.predict(features)
-            logger.info(f"Model prediction: {prediction}")
-
-            # -----------------------------------------------------------
-            # 4) Render result
-            # -----------------------------------------------------------
-            return render_template("index.html", prediction=prediction[0])
+            return render_template("index.html", prediction=prediction)
 
         except Exception as e:
             # Log the error and surface a clean message to the user via the template
-            logger.error(f"Prediction request failed: {e}")
+            logger.error("Prediction request failed: %s", e)
             # You may choose to pass an error message to the template if it supports it
             # e.g., return render_template("index.html", prediction=None, error=str(e))
             return render_template("index.html", prediction=None)
@@ -219,9 +517,76 @@ def index():
     return render_template("index.html", prediction=None)
 
 
+@app.route("/predict_batch", methods=["POST"])
+def predict_batch():
+    """
+    Score many bookings in one vectorised model call.
+
+    Expects a JSON body of the form ``{"rows": [{"lead_time": 300, ...}, ...]}``
+    where each row is an object keyed by model feature name (`FEATURE_NAMES`).
+    Rows are arranged into the model's column order on the server, so the
+    contract does not depend on the feature order learned at training time.
+
+    Returns
+    -------
+    flask.Response
+        JSON with per-row ``predictions`` (0 = cancel, 1 = not cancel) and
+        ``probabilities`` of class 1, or an ``error`` with status 400 when
+        the payload is malformed or holds non-numeric (including boolean)
+        or non-finite values. Bodies larger than `MAX_REQUEST_BYTES` are
+        refused with 413 before being parsed.
+    """
+    try:
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict) or "rows" not in payload:
+            raise ValueError("expected a JSON object with a 'rows' list")
+        records = payload["rows"]
+        if not isinstance(records, list):
+            raise ValueError("'rows' must be a list of objects keyed by feature name")
+        if len(records) > MAX_BATCH_ROWS:
+            raise ValueError(f"At most {MAX_BATCH_ROWS} rows may be scored per request")
+        rows = np.empty((len(records), N_FEATURES), dtype=np.float32, order="C")
+        for i, record in enumerate(records):
+            if not isinstance(record, dict):
+                raise ValueError(f"row {i} must be an object keyed by feature name")
+            if record.keys() != _FEATURE_SET:
+                problems = [
+                    f"{label} features {sorted(names)}"
+                    for label, names in (
+                        ("missing", _FEATURE_SET - record.keys()),
+                        ("unknown", record.keys() - _FEATURE_SET),
+                    )
+                    if names
+                ]
+                raise ValueError(f"row {i} has {' and '.join(problems)}")
+            values = [record[name] for name in FEATURE_NAMES]
+            for name, value in zip(FEATURE_NAMES, values):
+                # numpy would coerce booleans and numeric strings on assignment
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(f"row {i} feature '{name}' must be a JSON number")
+            try:
+                with np.errstate(over="ignore"):  # out-of-range values become inf, rejected below
+                    rows[i] = values
+            except OverflowError:  # ints past float64 range raise instead of becoming inf
+                rows[i] = np.inf
+        if not np.isfinite(rows).all():
+            raise ValueError("feature values must be finite numbers within float32 range")
+    except (TypeError, ValueError) as e:
+        logger.error("Batch prediction request rejected: %s", e)
+        return jsonify(error=f"Invalid batch payload: {e}"), 400
+
+    proba = predict_proba(rows)
+    logger.info("Batch prediction served for %d rows", len(rows))
+    return jsonify(
+        predictions=(proba > DECISION_THRESHOLD).astype(int).tolist(),
+        probabilities=proba.tolist(),
+    )
+
+
 # -------------------------------------------------------------------
 # Entrypoint
 # -------------------------------------------------------------------
 if __name__ == "__main__":
+    # Development server only; production runs via `gunicorn -c gunicorn.conf.py app:app`.
     # Bind to all interfaces for containerised / remote access; keep port 8080 as specified.
     app.run(host="0.0.0.0", port=8080)
\ No newline at end of file
@@ -3,7 +3,7 @@ model_params.py
 ----------------
 Hyperparameter configuration module for the MLOps Hotel Reservation Prediction project.
 
-This file defines the **LightGBM search space** and **RandomizedSearchCV parameters**
+This file defines the **LightGBM search space** and **random search parameters**
 used during the model training stage. The parameter ranges are intentionally broad
 to allow for flexible experimentation while maintaining computational efficiency.
 
@@ -15,24 +15,48 @@ Example:
 Notes
 -----
 - The search spaces leverage SciPy distributions for continuous sampling.
-- These parameters are used in conjunction with `RandomizedSearchCV`.
+- `top_rate`/`other_rate` only apply to GOSS candidates and are dropped for
+  bagging ones; GOSS candidates drop any `bagging_fraction`, which LightGBM
+  rejects alongside GOSS.
+- Candidates are sampled with `ParameterSampler` (as `RandomizedSearchCV` would)
+  and cross-validated by `ModelTraining.train_lgbm` with `lightgbm.cv`, which
+  early-stops each candidate on the CV metric. The search successively halves
+  the candidates (`factor`), scoring them on growing subsamples that start at
+  `min_resources` rows and end with the full training set.
 - Adjust `n_iter` and `cv` for more exhaustive or faster searches.
+- `LIGHTGBM_FIXED` gives LightGBM the search's CPU budget (`n_jobs`); the
+  folds of `lightgbm.cv` are boosted one after another. Importing this module
+  also defaults `OMP_NUM_THREADS` to that budget.
+- The final full-data refit runs on the CPU unless `LIGHTGBM_REFIT_DEVICE`
+  (env var of the same name) requests e.g. "cuda"; a requested device that
+  this LightGBM build or machine lacks falls back to the CPU with a warning.
+  The CV search always stays on CPU.
 """
 
 # -------------------------------------------------------------------
 # Standard Library Imports
 # -------------------------------------------------------------------
+import os
+
+# -------------------------------------------------------------------
+# Third-Party Imports
+# -------------------------------------------------------------------
 from scipy.stats import randint, uniform
 
 # -------------------------------------------------------------------
 # 🌳 LIGHTGBM HYPERPARAMETER SPACE
 # -------------------------------------------------------------------
+# The number of boosting rounds is not searched: early stopping picks it.
 LIGHTGBM_PARAMS = {
-    'n_estimators': randint(100, 500),          # Number of boosting rounds
     'max_depth': randint(5, 50),                # Depth of each tree
     'learning_rate': uniform(0.01, 0.2),        # Step size shrinkage
     'num_leaves': randint(20, 100),             # Maximum number of leaves per tree
-    'boosting_type': ['gbdt', 'dart']           # Gradient boosting variants
+    'boosting_type': ['gbdt'],                  # Gradient boosting variant (dart cannot early-stop)
+    'data_sample_strategy': ['bagging', 'goss'],  # Row sampling; GOSS keeps large-gradient rows
+    'top_rate': uniform(0.1, 0.2),              # GOSS: share of large-gradient rows kept
+    'other_rate': uniform(0.05, 0.15),          # GOSS: share of small-gradient rows sampled
+    'colsample_bytree': uniform(0.6, 0.4),      # Feature fraction per tree
+    'max_bin': [127, 255]                       # Histogram bins per feature
 }
 
 # -------------------------------------------------------------------
@@ -44,5 +68,34 @@ RANDOM_SEARCH_PARAMS = {
     'n_jobs': -1,               # Use all available CPU cores
     'verbose': 2,               # Verbosity level
     'random_state': 5901,       # For reproducibility
-    'scoring': 'accuracy'       # Optimisation metric
-}
\ No newline at end of file
+    'scoring': 'accuracy',      # Optimisation metric (also roc_auc, neg_log_loss, average_precision, f1)
+    'num_boost_round': 2000,    # Upper bound on boosting rounds per candidate
+    'early_stopping_rounds': 50, # Stop once the CV metric stalls this long
+    'factor': 3,                # Successive halving: keep the best 1/factor per rung
+    'min_resources': 2000,      # Rows in the first rung (at least 5% of the training set)
+}
+
+# -------------------------------------------------------------------
+# 🧵 FIXED LIGHTGBM SETTINGS (not searched)
+# -------------------------------------------------------------------
+_CPU_COUNT = os.cpu_count() or 1
+_SEARCH_WORKERS = (
+    RANDOM_SEARCH_PARAMS['n_jobs'] if RANDOM_SEARCH_PARAMS['n_jobs'] > 0
+    else max(1, _CPU_COUNT + 1 + RANDOM_SEARCH_PARAMS['n_jobs'])
+)
+
+# Cap OpenMP's pool to the same budget; this only takes effect if set before
+# LightGBM is first imported, so entry points import this module early.
+os.environ.setdefault('OMP_NUM_THREADS', str(_SEARCH_WORKERS))
+
+LIGHTGBM_FIXED = {
+    'num_threads': _SEARCH_WORKERS,                             # Folds run one at a time in lgb.cv
+    'force_col_wise': True,                                     # Skip row/col-wise auto-probe
+    'enable_bundle': True,                                      # Exclusive Feature Bundling
+    'deterministic': False                                      # Allow faster non-deterministic kernels
+}
+
+# -------------------------------------------------------------------
+# 🚀 FINAL REFIT DEVICE
+# -------------------------------------------------------------------
+LIGHTGBM_REFIT_DEVICE = os.environ.get('LIGHTGBM_REFIT_DEVICE', 'cpu')  # opt in with "cuda"
@@ -24,8 +24,10 @@ import os
 # -------------------------------------------------------------------
 RAW_DIR = "artifacts/raw"
 RAW_FILE_PATH = os.path.join(RAW_DIR, "raw.csv")
-TRAIN_FILE_PATH = os.path.join(RAW_DIR, "train.csv")
-TEST_FILE_PATH = os.path.join(RAW_DIR, "test.csv")
+TRAIN_FILE_PATH = os.path.join(RAW_DIR, "train.parquet")
+TEST_FILE_PATH = os.path.join(RAW_DIR, "test.parquet")
+# Digest of the `data_ingestion` config used for the current splits
+INGESTION_STAMP_PATH = os.path.join(RAW_DIR, "ingestion_config.sha256")
 
 CONFIG_PATH = "config/config.yaml"
 
@@ -33,14 +35,17 @@ CONFIG_PATH = "config/config.yaml"
 # 🧹 DATA PROCESSING
 # -------------------------------------------------------------------
 PROCESSED_DIR = "artifacts/processed"
-PROCESSED_TRAIN_DATA_PATH = os.path.join(PROCESSED_DIR, "processed_train.csv")
-PROCESSED_TEST_DATA_PATH = os.path.join(PROCESSED_DIR, "processed_test.csv")
+PROCESSED_TRAIN_DATA_PATH = os.path.join(PROCESSED_DIR, "processed_train.parquet")
+PROCESSED_TEST_DATA_PATH = os.path.join(PROCESSED_DIR, "processed_test.parquet")
 
 # -------------------------------------------------------------------
 # 🧠 MODEL TRAINING
 # -------------------------------------------------------------------
 MODELS_DIR = "artifacts/models"
-MODEL_OUTPUT_PATH = os.path.join(MODELS_DIR, "lgbm_model.pkl")
+MODEL_OUTPUT_PATH = os.path.join(MODELS_DIR, "lgbm_model.txt")
+ONNX_MODEL_OUTPUT_PATH = os.path.join(MODELS_DIR, "lgbm_model.onnx")
+# Pickled LGBMClassifier from before the text format; read only as a fallback
+LEGACY_MODEL_PATH = os.path.join(MODELS_DIR, "lgbm_model.pkl")
 
 # Ensure key directories exist
 os.makedirs(RAW_DIR, exist_ok=True)
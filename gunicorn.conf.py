@@ -0,0 +1,59 @@
+"""
+gunicorn.conf.py
+----------------
+Production WSGI server configuration for the Flask inference app.
+
+The prediction path is short and CPU-light, so concurrency comes from
+cooperative gevent workers rather than Flask's single-threaded dev server.
+The app (and therefore the model) is imported once in the master and
+inherited by every forked worker.
+
+Usage
+-----
+From the project root:
+    gunicorn -c gunicorn.conf.py app:app
+
+Notes
+-----
+- `PORT` and `WEB_CONCURRENCY` may be set in the environment (e.g. by Cloud Run)
+  to override the bind port and worker count.
+- `preload_app` loads the model once in the master; workers share it copy-on-write.
+- Logging defaults to WARNING here so per-request INFO records are skipped
+  before any formatting; export `LOG_LEVEL=INFO` to see them.
+- `post_fork` re-runs the model warm-up inside each worker, since thread
+  pools and per-thread buffers created in the master do not survive fork.
+"""
+
+# -------------------------------------------------------------------
+# Standard Library Imports
+# -------------------------------------------------------------------
+import os
+
+# -------------------------------------------------------------------
+# 📝 Logging
+# -------------------------------------------------------------------
+# Read by src.logger when the app is preloaded below
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+# -------------------------------------------------------------------
+# 🌐 Server Socket
+# -------------------------------------------------------------------
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+
+# -------------------------------------------------------------------
+# ⚙️ Worker Processes
+# -------------------------------------------------------------------
+worker_class = "gevent"                                         # Cooperative greenlet workers
+workers = int(os.environ.get("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+worker_connections = 1000                                       # Max concurrent clients per worker
+preload_app = True                                              # Load app/model once pre-fork
+
+
+# -------------------------------------------------------------------
+# 🔥 Server Hooks
+# -------------------------------------------------------------------
+def post_fork(server, worker):
+    """Warm the model in each freshly forked worker before it takes traffic."""
+    from app import warm_up
+
+    warm_up()
@@ -11,49 +11,139 @@ This script orchestrates the three major stages of the workflow:
 Each stage is modularised in `src/` and configured via `config/` YAML files.
 Running this script executes the complete data-to-model process end-to-end.
 
+A stage is skipped when all of its outputs already exist and are newer than
+its inputs (data, config, and the stage's own code/parameter modules), so
+repeat runs only redo the work affected by a change. Ingestion is keyed on a
+digest of the `data_ingestion` config section instead, so editing other keys
+does not re-download the raw data.
+
 Usage
 -----
-    python src/main_pipeline.py
+    python pipeline/training_pipeline.py            # skip up-to-date stages
+    python pipeline/training_pipeline.py --force    # re-run every stage
 """
 
 # -------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------
+import argparse
+import hashlib
+import json
+import os
+from typing import List
+
+import config.model_params  # noqa: F401  (sets OMP_NUM_THREADS before LightGBM loads)
 from src.data_ingestion import DataIngestion
 from src.data_preprocessing import DataProcessor
 from src.model_training import ModelTraining
+from src.logger import get_logger
 from utils.common_functions import read_yaml
 from config.paths_config import *
 
+logger = get_logger(__name__)
+
+# Code/config that shapes each stage's outputs besides its data inputs
+PREPROCESSING_SOURCES = ["src/data_preprocessing.py", "utils/common_functions.py"]
+TRAINING_SOURCES = [
+    "src/model_training.py",
+    "src/lgbm_metrics.py",
+    "config/model_params.py",
+    "utils/common_functions.py",
+]
+
+
+# -------------------------------------------------------------------
+# Helpers: Stage Freshness
+# -------------------------------------------------------------------
+def _up_to_date(outputs: List[str], inputs: List[str]) -> bool:
+    """
+    Return True when every output exists and none is older than any input.
+
+    Parameters
+    ----------
+    outputs : List[str]
+        Files produced by the stage.
+    inputs : List[str]
+        Files the stage reads (missing inputs are ignored).
+    """
+    if not all(os.path.exists(o) for o in outputs):
+        return False
+    input_mtimes = [os.path.getmtime(i) for i in inputs if os.path.exists(i)]
+    if not input_mtimes:
+        return True
+    return min(os.path.getmtime(o) for o in outputs) >= max(input_mtimes)
+
+
+def _config_digest(section: dict) -> str:
+    """Return a stable SHA-256 hex digest of a config section."""
+    payload = json.dumps(section, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _stamp_matches(stamp_path: str, digest: str) -> bool:
+    """Return True when `stamp_path` records `digest` from the last run."""
+    try:
+        with open(stamp_path, "r", encoding="utf-8") as f:
+            return f.read().strip() == digest
+    except FileNotFoundError:
+        return False
+
 
 # -------------------------------------------------------------------
 # Pipeline Orchestration
 # -------------------------------------------------------------------
 if __name__ == "__main__":
 
+    parser = argparse.ArgumentParser(description="Run the hotel reservation training pipeline.")
+    parser.add_argument("--force", action="store_true", help="Re-run all stages even if outputs are current.")
+    args = parser.parse_args()
+
     # ===============================================================
     # 1️⃣  DATA INGESTION
     # ===============================================================
-    data_ingestion = DataIngestion(read_yaml(CONFIG_PATH))
-    data_ingestion.run()
+    config = read_yaml(CONFIG_PATH)
+    ingestion_digest = _config_digest(config["data_ingestion"])
+    if (
+        args.force
+        or not _up_to_date([TRAIN_FILE_PATH, TEST_FILE_PATH], [])
+        or not _stamp_matches(INGESTION_STAMP_PATH, ingestion_digest)
+    ):
+        data_ingestion = DataIngestion(config)
+        data_ingestion.run()
+        with open(INGESTION_STAMP_PATH, "w", encoding="utf-8") as f:
+            f.write(ingestion_digest)
+    else:
+        logger.info("Skipping data ingestion: train/test splits are up to date.")
 
     # ===============================================================
     # 2️⃣  DATA PREPROCESSING
     # ===============================================================
-    processor = DataProcessor(
-        TRAIN_FILE_PATH,
-        TEST_FILE_PATH,
-        PROCESSED_DIR,
-        CONFIG_PATH
-    )
-    processor.process()
+    if args.force or not _up_to_date(
+        [PROCESSED_TRAIN_DATA_PATH, PROCESSED_TEST_DATA_PATH],
+        [TRAIN_FILE_PATH, TEST_FILE_PATH, CONFIG_PATH, *PREPROCESSING_SOURCES],
+    ):
+        processor = DataProcessor(
+            TRAIN_FILE_PATH,
+            TEST_FILE_PATH,
+            PROCESSED_DIR,
+            CONFIG_PATH
+        )
+        processor.process()
+    else:
+        logger.info("Skipping data preprocessing: processed data is up to date.")
 
     # ===============================================================
     # 3️⃣  MODEL TRAINING
     # ===============================================================
-    trainer = ModelTraining(
-        PROCESSED_TRAIN_DATA_PATH,
-        PROCESSED_TEST_DATA_PATH,
-        MODEL_OUTPUT_PATH
-    )
-    trainer.run()
\ No newline at end of file
+    if args.force or not _up_to_date(
+        [MODEL_OUTPUT_PATH, ONNX_MODEL_OUTPUT_PATH],
+        [PROCESSED_TRAIN_DATA_PATH, PROCESSED_TEST_DATA_PATH, CONFIG_PATH, *TRAINING_SOURCES],
+    ):
+        trainer = ModelTraining(
+            PROCESSED_TRAIN_DATA_PATH,
+            PROCESSED_TEST_DATA_PATH,
+            MODEL_OUTPUT_PATH
+        )
+        trainer.run()
+    else:
+        logger.info("Skipping model training: model artefacts are up to date.")
@@ -12,12 +12,11 @@ Usage
 Example (within any module):
 
     from src.custom_exception import CustomException
-    import sys
 
     try:
         result = 10 / 0
     except Exception as e:
-        raise CustomException(str(e), sys)
+        raise CustomException("Division failed") from e
 
 Notes
 -----
@@ -32,6 +31,7 @@ from __future__ import annotations
 # -------------------------------------------------------------------
 import sys
 import traceback
+from types import FrameType
 
 
 # -------------------------------------------------------------------
@@ -46,8 +46,9 @@ class CustomException(Exception):
     ----------
     error_message : str
         The original error message to be displayed.
-    error_detail : sys
-        The system module providing traceback details.
+    cause : BaseException, optional
+        The exception being wrapped. Defaults to the exception currently
+        being handled, if any.
 
     Attributes
     ----------
@@ -55,15 +56,24 @@ class CustomException(Exception):
         The formatted error message including file name and line number.
     """
 
-    def __init__(self, error_message: str, error_detail: sys):
+    def __init__(self, error_message: str, cause: BaseException | None = None):
         super().__init__(error_message)
-        self.error_message = self.get_detailed_error_message(error_message, error_detail)
+        # The raising frame is the first caller outside this and any
+        # subclass `__init__` chaining up to it
+        caller = sys._getframe(1)
+        while caller.f_back is not None and caller.f_locals.get("self") is self:
+            caller = caller.f_back
+        self.error_message = self.get_detailed_error_message(error_message, cause, caller)
 
     # -------------------------------------------------------------------
     # Static Method: Error Message Formatter
     # -------------------------------------------------------------------
     @staticmethod
-    def get_detailed_error_message(error_message: str, error_detail: sys) -> str:
+    def get_detailed_error_message(
+        error_message: str,
+        cause: BaseException | None = None,
+        frame: FrameType | None = None,
+    ) -> str:
         """
         Constructs a detailed error message containing the file name,
         line number, and original error text.
@@ -72,18 +82,24 @@ class CustomException(Exception):
         ----------
         error_message : str
             The message describing the error.
-        error_detail : sys
-            The system module, used to extract traceback details.
+        cause : BaseException, optional
+            The wrapped exception whose traceback locates the error.
+        frame : types.FrameType, optional
+            Frame reported when there is no traceback to use (no `cause` and
+            no exception being handled). Defaults to the caller's frame.
 
         Returns
         -------
         str
             A formatted message including file name and line number.
         """
-        _, _, exc_tb = error_detail.exc_info()
-        file_name = exc_tb.tb_frame.f_code.co_filename
-        line_number = exc_tb.tb_lineno
-        return f"Error in {file_name}, line {line_number}: {error_message}"
+        tb = cause.__traceback__ if cause is not None else sys.exc_info()[2]
+        if tb is not None:
+            location = traceback.extract_tb(tb, limit=1)[0]
+        else:
+            # Raised outside an except block: report the raising line instead
+            location = traceback.extract_stack(frame or sys._getframe(1), limit=1)[0]
+        return f"Error in {location.filename}, line {location.lineno}: {error_message}"
 
     # -------------------------------------------------------------------
     # String Representation
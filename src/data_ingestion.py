@@ -1,7 +1,7 @@
 """
 data_ingestion.py
 -----------------
-Implements the DataIngestion class responsible for downloading
+Implements the DataIngestion class responsible for streaming
 the hotel reservation dataset from Google Cloud Storage (GCS),
 splitting it into train and test sets, and saving them locally.
 
@@ -20,6 +20,8 @@ Notes
 - Requires GCP credentials to be set via the environment variable:
   GOOGLE_APPLICATION_CREDENTIALS
 - Automatically creates necessary directories under `artifacts/raw/`
+- One authenticated GCS client is shared per process; downloads are
+  verified with CRC32C (C-accelerated when `google-crc32c` is installed).
 """
 
 from __future__ import annotations
@@ -27,10 +29,13 @@ from __future__ import annotations
 # -------------------------------------------------------------------
 # Standard & Third-Party Imports
 # -------------------------------------------------------------------
+import io
 import os
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from google.cloud import storage
-from sklearn.model_selection import train_test_split
 
 # -------------------------------------------------------------------
 # Internal Imports
@@ -46,6 +51,21 @@ from utils.common_functions import read_yaml
 logger = get_logger(__name__)
 
 
+# -------------------------------------------------------------------
+# GCS Client
+# -------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_gcs_client() -> storage.Client:
+    """
+    Return the process-wide GCS client, creating it on first use.
+
+    Building a client performs credential discovery and an auth handshake,
+    so it is done once and reused rather than per download. Creation is
+    deferred so importing this module does not require GCP credentials.
+    """
+    return storage.Client()
+
+
 # -------------------------------------------------------------------
 # Class: DataIngestion
 # -------------------------------------------------------------------
@@ -54,9 +74,9 @@ class DataIngestion:
     Handles the ingestion of raw hotel reservation data from a GCP bucket.
 
     This includes:
-    - Downloading the dataset from the configured GCP bucket.
+    - Streaming the dataset from the configured GCP bucket into memory.
     - Splitting the data into train and test subsets.
-    - Saving the results into local CSV files for further processing.
+    - Saving the results into local Parquet files for further processing.
 
     Parameters
     ----------
@@ -82,39 +102,54 @@ class DataIngestion:
     # -------------------------------------------------------------------
     # Method: download_csv_from_gcp
     # -------------------------------------------------------------------
-    def download_csv_from_gcp(self) -> None:
+    def download_csv_from_gcp(self) -> pd.DataFrame:
         """
-        Download the raw CSV dataset from Google Cloud Storage.
+        Stream the raw CSV dataset from Google Cloud Storage into pandas.
+
+        The blob is fetched into memory with CRC32C validation and parsed
+        from there, so the raw file is never written to (and re-read from)
+        local disk.
 
-        The file is downloaded from the specified bucket and saved to
-        `artifacts/raw/raw.csv`.
+        Returns
+        -------
+        pd.DataFrame
+            The full raw dataset.
 
         Raises
         ------
         CustomException
-            If any error occurs during the file download.
+            If any error occurs during the download or parsing.
         """
         try:
-            client = storage.Client()
-            bucket = client.bucket(self.bucket_name)
+            bucket = get_gcs_client().bucket(self.bucket_name)
             blob = bucket.blob(self.file_name)
-            blob.download_to_filename(RAW_FILE_PATH)
 
-            logger.info(f"CSV file successfully downloaded to {RAW_FILE_PATH}")
+            payload = blob.download_as_bytes(checksum="crc32c")
+            data = pd.read_csv(io.BytesIO(payload), engine="pyarrow")
+
+            logger.info(f"CSV file successfully streamed from GCS: shape={data.shape}")
+            return data
 
         except Exception as e:
             logger.error("Error while downloading the CSV file.")
-            import sys
-            raise CustomException("Failed to download CSV file", sys) from e
+            raise CustomException("Failed to download CSV file") from e
 
     # -------------------------------------------------------------------
     # Method: split_data
     # -------------------------------------------------------------------
-    def split_data(self) -> None:
+    def split_data(self, data: pd.DataFrame) -> None:
         """
         Split the downloaded dataset into training and test sets
         based on the train/test ratio from configuration.
 
+        Rows are assigned via a single seeded permutation of positions,
+        avoiding the intermediate copies made by `train_test_split`.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The raw dataset returned by `download_csv_from_gcp`.
+
         Raises
         ------
         CustomException
@@ -123,21 +158,22 @@ class DataIngestion:
         try:
             logger.info("Starting data split process.")
 
-            data = pd.read_csv(RAW_FILE_PATH)
-            train_data, test_data = train_test_split(
-                data, test_size=1 - self.train_test_ratio, random_state=5901
-            )
+            rng = np.random.default_rng(5901)
+            perm = rng.permutation(len(data))
+            cut = int(len(data) * self.train_test_ratio)
+
+            train_data = data.iloc[perm[:cut]]
+            test_data = data.iloc[perm[cut:]]
 
-            train_data.to_csv(TRAIN_FILE_PATH, index=False)
-            test_data.to_csv(TEST_FILE_PATH, index=False)
+            train_data.to_parquet(TRAIN_FILE_PATH, engine="pyarrow", compression="snappy", index=False)
+            test_data.to_parquet(TEST_FILE_PATH, engine="pyarrow", compression="snappy", index=False)
 
             logger.info(f"Train data saved to {TRAIN_FILE_PATH}")
             logger.info(f"Test data saved to {TEST_FILE_PATH}")
 
         except Exception as e:
             logger.error("Error while splitting the dataset.")
-            import sys
-            raise CustomException("Failed to split data into train and test sets", sys) from e
+            raise CustomException("Failed to split data into train and test sets") from e
 
     # -------------------------------------------------------------------
     # Method: run
@@ -145,7 +181,7 @@ class DataIngestion:
     def run(self) -> None:
         """
         Orchestrates the full data ingestion process:
-        1. Downloads the raw dataset from GCP.
+        1. Streams the raw dataset from GCP.
         2. Splits it into train/test sets.
         3. Logs the overall process.
 
@@ -156,8 +192,8 @@ class DataIngestion:
         try:
             logger.info("Starting data ingestion pipeline.")
 
-            self.download_csv_from_gcp()
-            self.split_data()
+            data = self.download_csv_from_gcp()
+            self.split_data(data)
 
             logger.info("Data ingestion completed successfully.")
 
@@ -0,0 +1,251 @@
+"""
+lgbm_to_arrays.py
+-----------------
+Flattens a trained LightGBM Booster into contiguous NumPy arrays and
+evaluates the ensemble with a Numba-compiled kernel.
+
+For single-row inference the cost of LightGBM's predict is dominated by the
+Python/C call overhead rather than by tree traversal itself. Walking the
+flattened trees inside one `@njit` function removes that overhead entirely.
+
+Usage
+-----
+Example:
+    from src.lgbm_to_arrays import booster_to_arrays, predict_proba
+
+    ensemble = booster_to_arrays(model.booster_)
+    proba = predict_proba(X.astype("float32"), ensemble)
+
+Notes
+-----
+- Only single-output binary models (`objective="binary"`) are supported.
+- Split semantics mirror LightGBM's C++ `NumericalDecision` and
+  `CategoricalDecision`, including missing-value defaults.
+- Compiled kernels are cached on disk (`cache=True`) after the first call.
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------------
+# Standard Library Imports
+# -------------------------------------------------------------------
+from typing import NamedTuple
+
+# -------------------------------------------------------------------
+# Third-Party Imports
+# -------------------------------------------------------------------
+import numpy as np
+from numba import njit
+
+# -------------------------------------------------------------------
+# Constants (mirroring LightGBM's tree.h)
+# -------------------------------------------------------------------
+MISSING_NONE = 0
+MISSING_ZERO = 1
+MISSING_NAN = 2
+_MISSING_TYPES = {"None": MISSING_NONE, "Zero": MISSING_ZERO, "NaN": MISSING_NAN}
+
+K_ZERO_THRESHOLD = 1e-35
+
+
+# -------------------------------------------------------------------
+# Container: EnsembleArrays
+# -------------------------------------------------------------------
+class EnsembleArrays(NamedTuple):
+    """
+    Flat, per-node representation of a LightGBM tree ensemble.
+
+    Nodes of all trees are stored back to back; tree `t` starts at node
+    `tree_offsets[t]`. Leaves are marked with `feature == -1`.
+    """
+
+    tree_offsets: np.ndarray      # int32, (n_trees + 1,)
+    feature: np.ndarray           # int32, split feature or -1 for leaves
+    threshold: np.ndarray         # float64, numerical split threshold
+    left: np.ndarray              # int32, absolute index of left child
+    right: np.ndarray             # int32, absolute index of right child
+    leaf_value: np.ndarray        # float64, leaf output (0 for internal nodes)
+    default_left: np.ndarray      # bool, direction taken by missing values
+    missing_type: np.ndarray      # int8, one of MISSING_NONE/ZERO/NAN
+    is_categorical: np.ndarray    # bool, '==' (categorical) split
+    cat_start: np.ndarray         # int32, first bitset word of a categorical split
+    cat_end: np.ndarray           # int32, one past the last bitset word
+    cat_bits: np.ndarray          # uint32, concatenated category bitsets
+    sigmoid: float                # sigmoid scale from the binary objective
+    average_output: bool          # True for random-forest mode
+
+
+# -------------------------------------------------------------------
+# Function: booster_to_arrays
+# -------------------------------------------------------------------
+def booster_to_arrays(booster) -> EnsembleArrays:
+    """
+    Convert a binary LightGBM Booster into an `EnsembleArrays` bundle.
+
+    Parameters
+    ----------
+    booster : lightgbm.Booster
+        Trained booster (e.g. `LGBMClassifier.booster_`).
+
+    Returns
+    -------
+    EnsembleArrays
+        Flattened ensemble ready for `predict_proba`.
+
+    Raises
+    ------
+    ValueError
+        If the model is not a single-output binary classifier.
+    """
+    dump = booster.dump_model()
+
+    objective = dump.get("objective", "").split()
+    if not objective or objective[0] != "binary" or dump.get("num_tree_per_iteration", 1) != 1:
+        raise ValueError(f"Unsupported LightGBM objective for array export: {dump.get('objective')}")
+    sigmoid = 1.0
+    for token in objective[1:]:
+        if token.startswith("sigmoid:"):
+            sigmoid = float(token.split(":", 1)[1])
+
+    feature, threshold, left, right, leaf_value = [], [], [], [], []
+    default_left, missing_type, is_categorical = [], [], []
+    cat_start, cat_end, cat_bits = [], [], []
+    tree_offsets = [0]
+
+    def _add_node(node: dict) -> int:
+        idx = len(feature)
+        feature.append(-1)
+        threshold.append(0.0)
+        left.append(-1)
+        right.append(-1)
+        leaf_value.append(0.0)
+        default_left.append(False)
+        missing_type.append(MISSING_NONE)
+        is_categorical.append(False)
+        cat_start.append(0)
+        cat_end.append(0)
+
+        if "leaf_value" in node:
+            leaf_value[idx] = float(node["leaf_value"])
+            return idx
+
+        feature[idx] = int(node["split_feature"])
+        default_left[idx] = bool(node.get("default_left", False))
+        missing_type[idx] = _MISSING_TYPES[node.get("missing_type", "None")]
+
+        if node["decision_type"] == "==":
+            # Categorical split: threshold is "c1||c2||..." -> bitset of categories
+            categories = [int(c) for c in str(node["threshold"]).split("||")]
+            words = np.zeros(max(categories) // 32 + 1, dtype=np.uint32)
+            for c in categories:
+                words[c // 32] |= np.uint32(1 << (c % 32))
+            is_categorical[idx] = True
+            cat_start[idx] = len(cat_bits)
+            cat_bits.extend(words.tolist())
+            cat_end[idx] = len(cat_bits)
+        else:
+            threshold[idx] = float(node["threshold"])
+
+        left[idx] = _add_node(node["left_child"])
+        right[idx] = _add_node(node["right_child"])
+        return idx
+
+    for tree in dump["tree_info"]:
+        _add_node(tree["tree_structure"])
+        tree_offsets.append(len(feature))
+
+    return EnsembleArrays(
+        tree_offsets=np.asarray(tree_offsets, dtype=np.int32),
+        feature=np.asarray(feature, dtype=np.int32),
+        threshold=np.asarray(threshold, dtype=np.float64),
+        left=np.asarray(left, dtype=np.int32),
+        right=np.asarray(right, dtype=np.int32),
+        leaf_value=np.asarray(leaf_value, dtype=np.float64),
+        default_left=np.asarray(default_left, dtype=np.bool_),
+        missing_type=np.asarray(missing_type, dtype=np.int8),
+        is_categorical=np.asarray(is_categorical, dtype=np.bool_),
+        cat_start=np.asarray(cat_start, dtype=np.int32),
+        cat_end=np.asarray(cat_end, dtype=np.int32),
+        cat_bits=np.asarray(cat_bits, dtype=np.uint32),
+        sigmoid=sigmoid,
+        average_output=bool(dump.get("average_output", False)),
+    )
+
+
+# -------------------------------------------------------------------
+# Kernel: _predict_raw
+# -------------------------------------------------------------------
+# fastmath is left off on purpose: it would let LLVM assume no NaNs and
+# drop the missing-value checks below.
+@njit(cache=True)
+def _predict_raw(
+    X, tree_offsets, feature, threshold, left, right, leaf_value,
+    default_left, missing_type, is_categorical, cat_start, cat_end, cat_bits,
+):
+    n_rows = X.shape[0]
+    n_trees = tree_offsets.shape[0] - 1
+    out = np.empty(n_rows, dtype=np.float64)
+
+    for i in range(n_rows):
+        acc = 0.0
+        for t in range(n_trees):
+            node = tree_offsets[t]
+            while feature[node] >= 0:
+                fval = np.float64(X[i, feature[node]])
+
+                if is_categorical[node]:
+                    # Range-check in float before casting: inf/huge values
+                    # must not wrap to a negative bitset index. LightGBM
+                    # truncates toward zero, so (-1, 0) is category 0;
+                    # NaN, <= -1 and anything past the bitset go right.
+                    go_left = False
+                    n_words = cat_end[node] - cat_start[node]
+                    if fval > -1.0 and fval < n_words * 32.0:
+                        cat = np.int64(fval)
+                        go_left = ((cat_bits[cat_start[node] + (cat >> 5)] >> (cat & 31)) & 1) == 1
+                else:
+                    mtype = missing_type[node]
+                    if np.isnan(fval) and mtype != MISSING_NAN:
+                        fval = 0.0
+                    if (mtype == MISSING_ZERO and abs(fval) <= K_ZERO_THRESHOLD) or (
+                        mtype == MISSING_NAN and np.isnan(fval)
+                    ):
+                        go_left = default_left[node]
+                    else:
+                        go_left = fval <= threshold[node]
+
+                node = left[node] if go_left else right[node]
+            acc += leaf_value[node]
+        out[i] = acc
+
+    return out
+
+
+# -------------------------------------------------------------------
+# Function: predict_proba
+# -------------------------------------------------------------------
+def predict_proba(X: np.ndarray, ensemble: EnsembleArrays) -> np.ndarray:
+    """
+    Compute P(class 1) for each row of `X`.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        2-D array of shape (n_rows, n_features), ideally float32 and C-contiguous.
+    ensemble : EnsembleArrays
+        Output of `booster_to_arrays`.
+
+    Returns
+    -------
+    np.ndarray
+        Float64 array of shape (n_rows,), matching `Booster.predict`.
+    """
+    raw = _predict_raw(
+        X, ensemble.tree_offsets, ensemble.feature, ensemble.threshold,
+        ensemble.left, ensemble.right, ensemble.leaf_value, ensemble.default_left,
+        ensemble.missing_type, ensemble.is_categorical, ensemble.cat_start,
+        ensemble.cat_end, ensemble.cat_bits,
+    )
+    if ensemble.average_output:
+        raw /= max(1, ensemble.tree_offsets.shape[0] - 1)
+    return 1.0 / (1.0 + np.exp(-ensemble.sigmoid * raw))
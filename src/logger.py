@@ -10,6 +10,10 @@ for each day based on the current date.
 It provides a simple helper function, `get_logger(name)`, that returns
 a configured logger instance for use across modules.
 
+Records are handed to a `QueueHandler` and written to disk by a
+background `QueueListener` thread, so callers (e.g. Flask request
+handlers) never block on file I/O.
+
 Usage
 -----
 Example (within any module):
@@ -24,15 +28,21 @@ Notes
 -----
 - All logs are written to `logs/log_YYYY-MM-DD.log`
 - Each message is timestamped and tagged with severity.
-- Default level: INFO
+- Default level: INFO, overridable with the `LOG_LEVEL` environment variable
+  (e.g. `LOG_LEVEL=WARNING` in production).
+- The listener is restarted in forked children (e.g. gunicorn workers) and
+  flushed at interpreter exit.
 """
 
 # -------------------------------------------------------------------
 # Standard Library Imports
 # -------------------------------------------------------------------
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 # -------------------------------------------------------------------
 # Directory Setup
@@ -47,12 +57,74 @@ os.makedirs(LOGS_DIR, exist_ok=True)
 # Create a log file named with the current date
 LOG_FILE = os.path.join(LOGS_DIR, f"log_{datetime.now().strftime('%Y-%m-%d')}.log")
 
-# Configure logging format and severity level
-logging.basicConfig(
-    filename=LOG_FILE,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    level=logging.INFO,
-)
+# Severity threshold shared by every project logger
+LOG_LEVEL = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+if not isinstance(LOG_LEVEL, int):
+    LOG_LEVEL = logging.INFO
+
+# The file handler lives behind the listener; the root logger only enqueues
+_file_handler = logging.FileHandler(LOG_FILE)
+_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread.
+
+    The stock `prepare` renders `msg % args` in the calling thread; the
+    listener shares this process, so the record can be queued untouched.
+    Pass immutable values (or copies) as log arguments accordingly.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_queue_handler = _DeferredQueueHandler(queue.SimpleQueue())
+logging.basicConfig(handlers=[_queue_handler], level=LOG_LEVEL)
+
+
+# -------------------------------------------------------------------
+# Background Listener
+# -------------------------------------------------------------------
+_listener = None
+
+
+def _start_listener() -> None:
+    """Start a listener thread draining a fresh queue into the log file."""
+    global _listener
+    # A queue inherited across fork may hold records or a lock owned by the
+    # parent's listener thread, so each process gets its own.
+    _queue_handler.queue = queue.SimpleQueue()
+    _listener = QueueListener(_queue_handler.queue, _file_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    if _listener is not None:
+        _listener.stop()
+
+
+_start_listener()
+atexit.register(_stop_listener)
+os.register_at_fork(after_in_child=_start_listener)
+
+
+# -------------------------------------------------------------------
+# Caller Lookup
+# -------------------------------------------------------------------
+def _skip_caller(stack_info: bool = False, stacklevel: int = 1):
+    """
+    Stand-in for `Logger.findCaller` on project loggers.
+
+    The log format only uses time, level and message, so the stack walk
+    that fills in file, line and function is skipped. The values match what
+    `logging` reports when caller lookup is disabled. Only loggers returned
+    by `get_logger` use this; other loggers (gunicorn, libraries) keep the
+    standard behaviour.
+    """
+    return "(unknown file)", 0, "(unknown function)", None
+
 
 # -------------------------------------------------------------------
 # Logger Factory Function
@@ -69,8 +141,9 @@ def get_logger(name: str) -> logging.Logger:
     Returns
     -------
     logging.Logger
-        A logger object with INFO-level configuration.
+        A logger object at the configured `LOG_LEVEL` (INFO by default).
     """
     logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
+    logger.findCaller = _skip_caller
     return logger
\ No newline at end of file
@@ -4,14 +4,14 @@ model_training.py
 Model training module for the MLOps Hotel Reservation Prediction project.
 
 This script implements a complete training pipeline using **LightGBM** with
-hyperparameter optimisation via **RandomizedSearchCV**, integrated with **MLflow**
-for experiment tracking and reproducibility.
+hyperparameter optimisation via a random search over `lightgbm.cv` with early
+stopping, integrated with **MLflow** for experiment tracking and reproducibility.
 
 The process includes:
   1) Loading and splitting processed data
-  2) Hyperparameter tuning with RandomizedSearchCV
+  2) Hyperparameter tuning with an early-stopped random search (stratified `lightgbm.cv`)
   3) Model evaluation using standard classification metrics
-  4) Saving the trained model artefact
+  4) Saving the trained model artefact (LightGBM text model + ONNX export)
   5) Logging artefacts, parameters, and metrics to MLflow
 
 Usage
@@ -26,24 +26,31 @@ Example:
 Notes
 -----
 - Depends on preprocessed data generated from `src/data_preprocessing.py`
-- Produces `artifacts/models/lgbm_model.pkl`
+- Produces `artifacts/models/lgbm_model.txt` and `artifacts/models/lgbm_model.onnx`
 - Logs experiments via MLflow for full traceability
 """
 
 # -------------------------------------------------------------------
 # Standard Library Imports
 # -------------------------------------------------------------------
+import hashlib
+import json
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# -------------------------------------------------------------------
+# Search Config (sets OMP_NUM_THREADS, so it must precede LightGBM)
+# -------------------------------------------------------------------
+from config.model_params import *
 
 # -------------------------------------------------------------------
 # Core Data & ML Libraries
 # -------------------------------------------------------------------
+import numpy as np
 import pandas as pd
-import joblib
 import lightgbm as lgb
-from scipy.stats import randint
-from sklearn.model_selection import RandomizedSearchCV
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+from sklearn.model_selection import ParameterSampler, StratifiedKFold, train_test_split
 
 # -------------------------------------------------------------------
 # Project Utilities & Config
@@ -51,20 +58,92 @@ from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_sc
 from src.logger import get_logger
 from src.custom_exception import CustomException
 from config.paths_config import *
-from config.model_params import *
-from utils.common_functions import read_yaml, load_data
+from utils.common_functions import read_yaml, load_data, downcast_dtypes
 
 # -------------------------------------------------------------------
 # Experiment Tracking
 # -------------------------------------------------------------------
 import mlflow
+import mlflow.data
 import mlflow.sklearn
+from mlflow.tracking import MlflowClient
+
+# -------------------------------------------------------------------
+# Model Export
+# -------------------------------------------------------------------
+import onnxmltools
+from onnxmltools.convert.common.data_types import FloatTensorType
 
 # -------------------------------------------------------------------
 # Logger Setup
 # -------------------------------------------------------------------
 logger = get_logger(__name__)
 
+# sklearn scoring name -> (LightGBM CV metric, whether higher is better)
+_CV_METRICS = {
+    "accuracy": ("binary_error", False),
+    "roc_auc": ("auc", True),
+    "neg_log_loss": ("binary_logloss", False),
+    "average_precision": ("average_precision", True),
+    "f1": ("f1", True),  # not built in; see src.lgbm_metrics
+}
+
+
+# -------------------------------------------------------------------
+# Helper: _constrain_sampling
+# -------------------------------------------------------------------
+# `bagging_fraction` and its LightGBM aliases
+_BAGGING_FRACTION_KEYS = ("bagging_fraction", "subsample", "sub_row", "bagging")
+
+
+def _constrain_sampling(params: dict) -> dict:
+    """
+    Make a sampled candidate's row-sampling settings valid for LightGBM.
+
+    GOSS rates are dropped for bagging candidates (where they do nothing).
+    GOSS candidates lose any bagging fraction, which LightGBM rejects
+    alongside GOSS ("Cannot use bagging in GOSS"), and have `other_rate`
+    capped so that `top_rate + other_rate <= 1`.
+    """
+    params = dict(params)
+    if params.get("data_sample_strategy", "bagging") != "goss":
+        params.pop("top_rate", None)
+        params.pop("other_rate", None)
+        return params
+    for key in _BAGGING_FRACTION_KEYS:
+        params.pop(key, None)
+    if params.get("top_rate", 0.2) + params.get("other_rate", 0.1) > 1.0:
+        params["other_rate"] = 1.0 - params.get("top_rate", 0.2)
+    return params
+
+
+# -------------------------------------------------------------------
+# Helper: _n_halvings
+# -------------------------------------------------------------------
+def _n_halvings(n: float, factor: int) -> int:
+    """Return floor(log_factor(n)), i.e. how often `n` can be divided by `factor`."""
+    count = 0
+    while n >= factor:
+        n /= factor
+        count += 1
+    return count
+
+
+# -------------------------------------------------------------------
+# Helper: _n_rungs
+# -------------------------------------------------------------------
+def _n_rungs(n_candidates: int, n_samples: int, min_resources: int, factor: int) -> int:
+    """
+    Return the number of successive-halving rungs.
+
+    Each extra rung divides the candidates by `factor` and multiplies the
+    rows by `factor`, so there are as many extra rungs as both the candidate
+    pool and the growth from `min_resources` to `n_samples` rows allow. The
+    last rung always uses all rows; with `min_resources >= n_samples` the
+    search is a single full-data rung.
+    """
+    return 1 + min(_n_halvings(n_candidates, factor), _n_halvings(n_samples / min_resources, factor))
+
 
 # -------------------------------------------------------------------
 # Class: ModelTraining
@@ -81,16 +160,32 @@ class ModelTraining:
         Path to the preprocessed test dataset.
     model_output_path : str
         Destination path for the trained model pickle file.
+    onnx_output_path : str, optional
+        Destination path for the ONNX export used by the inference app.
+    config_path : str, optional
+        YAML config whose `data_processing.categorical_columns` are passed to
+        LightGBM as categorical features.
     """
 
-    def __init__(self, train_path: str, test_path: str, model_output_path: str):
+    def __init__(
+        self,
+        train_path: str,
+        test_path: str,
+        model_output_path: str,
+        onnx_output_path: str = ONNX_MODEL_OUTPUT_PATH,
+        config_path: str = CONFIG_PATH,
+    ):
         self.train_path = train_path
         self.test_path = test_path
         self.model_output_path = model_output_path
+        self.onnx_output_path = onnx_output_path
 
         # Load parameter spaces from config
         self.params_dist = LIGHTGBM_PARAMS
         self.random_search_params = RANDOM_SEARCH_PARAMS
+        self.fixed_params = LIGHTGBM_FIXED
+        self.refit_device = LIGHTGBM_REFIT_DEVICE
+        self.categorical_columns = read_yaml(config_path)["data_processing"]["categorical_columns"]
 
     # -------------------------------------------------------------------
     # Method: load_and_split_data
@@ -106,10 +201,16 @@ class ModelTraining:
         """
         try:
             logger.info(f"Loading training data from: {self.train_path}")
-            train_df = load_data(self.train_path)
-
             logger.info(f"Loading test data from: {self.test_path}")
-            test_df = load_data(self.test_path)
+
+            # Read both splits concurrently; pyarrow releases the GIL while decoding
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                train_df, test_df = pool.map(load_data, (self.train_path, self.test_path))
+
+            # No-ops for the Parquet splits written by preprocessing, which are
+            # already compact; CSV inputs would otherwise arrive as 64-bit.
+            train_df = train_df.astype(downcast_dtypes(train_df))
+            test_df = test_df.astype(downcast_dtypes(test_df))
 
             X_train = train_df.drop(columns=["booking_status"])
             y_train = train_df["booking_status"]
@@ -122,50 +223,171 @@ class ModelTraining:
 
         except Exception as e:
             logger.error(f"Error while loading data: {e}")
-            raise CustomException("Failed to load and split data", e)
+            raise CustomException("Failed to load and split data") from e
 
     # -------------------------------------------------------------------
     # Method: train_lgbm
     # -------------------------------------------------------------------
     def train_lgbm(self, X_train, y_train):
         """
-        Trains a LightGBM classifier using RandomizedSearchCV for hyperparameter tuning.
+        Trains a LightGBM classifier using a successive-halving random search
+        over `lightgbm.cv`.
+
+        Candidates are drawn exactly as `RandomizedSearchCV` would draw them.
+        As in `HalvingRandomSearchCV`, every candidate is first scored on a
+        small stratified subsample and only the best `1 / factor` are promoted
+        to the next, `factor`-times larger rung; the last rung uses the full
+        training set. Each score comes from `lightgbm.cv` on stratified folds
+        of the rung's rows, and boosting early-stops when the CV metric stops
+        improving, so the number of trees is chosen per candidate. Folds are
+        subsets of one in-process binned `Dataset` and are boosted by
+        LightGBM's own threads, so no training data is copied to workers. Label-encoded
+        categorical columns are declared to LightGBM so it can use native
+        category splits.
 
         Returns
         -------
-        lgb.LGBMClassifier
-            The best-performing LightGBM model found during random search.
+        tuple
+            The best candidate of the last rung refitted on the full training
+            set with its early-stopped number of trees (`lgb.LGBMClassifier`),
+            and the tuned parameters it was built with, including
+            `n_estimators`.
         """
         try:
-            logger.info("Initialising LightGBM model.")
-            lgbm_model = lgb.LGBMClassifier(random_state=self.random_search_params["random_state"])
-
-            logger.info("Starting hyperparameter tuning with RandomizedSearchCV.")
-
-            random_search = RandomizedSearchCV(
-                estimator=lgbm_model,
-                param_distributions=self.params_dist,
-                n_iter=self.random_search_params["n_iter"],
-                cv=self.random_search_params["cv"],
-                n_jobs=self.random_search_params["n_jobs"],
-                verbose=self.random_search_params["verbose"],
-                random_state=self.random_search_params["random_state"],
-                scoring=self.random_search_params["scoring"]
+            logger.info("Starting successive-halving search over LightGBM parameters with lightgbm.cv.")
+
+            search = self.random_search_params
+            metric, greater_is_better = _CV_METRICS[search["scoring"]]
+            feval = None
+            if metric == "f1":
+                # LightGBM has no native F1; use the Numba-compiled feval
+                from src.lgbm_metrics import f1_feval as feval
+            factor = search["factor"]
+
+            # Materialise the features once as the C-contiguous float32 matrix
+            # LightGBM consumes; names and categorical positions travel with it
+            # so no fit re-converts the DataFrame.
+            feature_names = X_train.columns.tolist()
+            categorical = [feature_names.index(c) for c in self.categorical_columns if c in feature_names]
+            X_arr = np.ascontiguousarray(X_train.to_numpy(dtype=np.float32))
+            y_arr = y_train.to_numpy()
+
+            candidates = [
+                _constrain_sampling(params)
+                for params in ParameterSampler(
+                    self.params_dist,
+                    n_iter=search["n_iter"],
+                    random_state=search["random_state"]
+                )
+            ]
+
+            # Bin the full training data once per `max_bin`; every rung, candidate
+            # and fold reuses those bin mappers through Dataset subsets.
+            datasets = {}
+
+            def binned(max_bin):
+                if max_bin not in datasets:
+                    datasets[max_bin] = lgb.Dataset(
+                        X_arr, y_arr,
+                        feature_name=feature_names,
+                        categorical_feature=categorical,
+                        params={"max_bin": max_bin, "verbosity": -1},
+                        free_raw_data=False
+                    ).construct()
+                return datasets[max_bin]
+
+            n_samples = len(y_arr)
+            min_resources = min(n_samples, max(search["min_resources"], n_samples // 20))
+            n_rungs = _n_rungs(len(candidates), n_samples, min_resources, factor)
+
+            # Candidates run one after another, so each lightgbm.cv call gets
+            # the whole thread budget in `fixed_params`. If candidates are ever
+            # run in parallel workers, drop `num_threads` to 1 per worker.
+            survivors = candidates
+            for rung in range(n_rungs):
+                last_rung = rung == n_rungs - 1
+                if last_rung:
+                    rows = None
+                    y_rung = y_arr
+                else:
+                    rows = np.sort(train_test_split(
+                        np.arange(n_samples),
+                        train_size=min_resources * factor ** rung,
+                        stratify=y_arr,
+                        random_state=search["random_state"] + rung
+                    )[0])
+                    y_rung = y_arr[rows]
+                folds = list(
+                    StratifiedKFold(
+                        n_splits=search["cv"], shuffle=True, random_state=search["random_state"]
+                    ).split(np.zeros(len(y_rung)), y_rung)
+                )
+
+                results = []
+                for i, params in enumerate(survivors, start=1):
+                    train_set = binned(params.get("max_bin", 255))
+                    cv_results = lgb.cv(
+                        params={
+                            "objective": "binary",
+                            "metric": "None" if feval else metric,
+                            "seed": search["random_state"],
+                            "verbosity": -1,
+                            **self.fixed_params,
+                            **params
+                        },
+                        train_set=train_set if rows is None else train_set.subset(rows),
+                        num_boost_round=search["num_boost_round"],
+                        folds=folds,
+                        feval=feval,
+                        callbacks=[lgb.early_stopping(search["early_stopping_rounds"], verbose=False)]
+                    )
+
+                    # Histories are truncated at the best iteration
+                    scores = cv_results[f"valid {metric}-mean"]
+                    score, rounds = scores[-1], len(scores)
+                    logger.info(
+                        f"Rung {rung + 1}/{n_rungs} ({len(y_rung)} rows), candidate "
+                        f"{i}/{len(survivors)}: {metric}={score:.4f} after {rounds} rounds, "
+                        f"params={params}"
+                    )
+                    results.append((score, rounds, params))
+
+                results.sort(key=lambda result: result[0], reverse=greater_is_better)
+                survivors = [params for _, _, params in results[:math.ceil(len(results) / factor)]]
+
+            best_score, best_rounds, best_params = results[0]
+
+            logger.info("Refitting best candidate on the full training set.")
+            refit_params = dict(
+                n_estimators=best_rounds,
+                random_state=search["random_state"],
+                **self.fixed_params,
+                **best_params
             )
-
-            random_search.fit(X_train, y_train)
-
-            best_params = random_search.best_params_
-            best_lgbm_model = random_search.best_estimator_
+            best_lgbm_model = None
+            if self.refit_device != "cpu":
+                try:
+                    best_lgbm_model = lgb.LGBMClassifier(device_type=self.refit_device, **refit_params)
+                    best_lgbm_model.fit(
+                        X_arr, y_arr, feature_name=feature_names, categorical_feature=categorical
+                    )
+                except lgb.basic.LightGBMError as e:
+                    logger.warning(f"Refit on device '{self.refit_device}' unavailable ({str(e).splitlines()[0]}); using the CPU.")
+                    best_lgbm_model = None
+            if best_lgbm_model is None:
+                best_lgbm_model = lgb.LGBMClassifier(**refit_params)
+                best_lgbm_model.fit(
+                    X_arr, y_arr, feature_name=feature_names, categorical_feature=categorical
+                )
 
             logger.info("Hyperparameter tuning completed successfully.")
-            logger.info(f"Best parameters: {best_params}")
+            logger.info(f"Best parameters: {best_params} (n_estimators={best_rounds})")
 
-            return best_lgbm_model
+            return best_lgbm_model, {**best_params, "n_estimators": best_rounds}
 
         except Exception as e:
             logger.error(f"Error while training model: {e}")
-            raise CustomException("Failed to train LightGBM model", e)
+            raise CustomException("Failed to train LightGBM model") from e
 
     # -------------------------------------------------------------------
     # Method: evaluate_model
@@ -174,6 +396,13 @@ class ModelTraining:
         """
         Evaluates the trained model on the test dataset.
 
+        Class-1 probabilities come straight from the Booster (early-stopped
+        iteration, if any), skipping the sklearn wrapper's input conversion
+        and two-column `predict_proba`. All four metrics come from one
+        confusion-matrix pass (`np.bincount`
+        over `2 * y_true + y_pred`), matching sklearn's binary scores with
+        `zero_division=0`.
+
         Returns
         -------
         dict
@@ -182,12 +411,17 @@ class ModelTraining:
         try:
             logger.info("Evaluating trained model performance.")
 
-            y_pred = model.predict(X_test)
+            probs = model.booster_.predict(X_test, num_iteration=model.best_iteration_ or None)
+            # Strict '>' matches the wrapper's argmax, which picks class 0 on a tie
+            y_pred = model.classes_[(probs > 0.5).astype(np.intp)]
+
+            cells = 2 * np.asarray(y_test, dtype=np.int64) + np.asarray(y_pred, dtype=np.int64)
+            tn, fp, fn, tp = np.bincount(cells, minlength=4).tolist()
 
-            accuracy = accuracy_score(y_test, y_pred)
-            precision = precision_score(y_test, y_pred)
-            recall = recall_score(y_test, y_pred)
-            f1 = f1_score(y_test, y_pred)
+            accuracy = (tp + tn) / max(tp + tn + fp + fn, 1)
+            precision = tp / (tp + fp) if tp + fp else 0.0
+            recall = tp / (tp + fn) if tp + fn else 0.0
+            f1 = 2 * tp / (2 * tp + fp + fn) if tp else 0.0
 
             logger.info(f"Accuracy Score  : {accuracy:.4f}")
             logger.info(f"Precision Score : {precision:.4f}")
@@ -203,29 +437,62 @@ class ModelTraining:
 
         except Exception as e:
             logger.error(f"Error while evaluating model: {e}")
-            raise CustomException("Failed to evaluate model", e)
+            raise CustomException("Failed to evaluate model") from e
 
     # -------------------------------------------------------------------
     # Method: save_model
     # -------------------------------------------------------------------
     def save_model(self, model):
         """
-        Saves the trained model to disk using joblib.
+        Saves the trained model's Booster in LightGBM's native text format.
+
+        The text dump is smaller than a pickle of the sklearn wrapper and
+        loads directly into `lgb.Booster(model_file=...)`, as the app does.
 
         Parameters
         ----------
-        model : object
+        model : lgb.LGBMClassifier
             Trained model to be saved.
         """
         try:
             os.makedirs(os.path.dirname(self.model_output_path), exist_ok=True)
             logger.info("Saving trained model to disk.")
-            joblib.dump(model, self.model_output_path)
+            booster = model.booster_
+            booster.save_model(self.model_output_path, num_iteration=booster.best_iteration)
             logger.info(f"Model successfully saved to: {self.model_output_path}")
 
         except Exception as e:
             logger.error(f"Error while saving model: {e}")
-            raise CustomException("Failed to save trained model", e)
+            raise CustomException("Failed to save trained model") from e
+
+    # -------------------------------------------------------------------
+    # Method: export_onnx
+    # -------------------------------------------------------------------
+    def export_onnx(self, model):
+        """
+        Converts the trained model to ONNX for serving with ONNX Runtime.
+
+        The graph takes a float32 `input` tensor of shape (n, n_features) and
+        returns `label` and `probabilities` tensors (no ZipMap).
+
+        Parameters
+        ----------
+        model : lgb.LGBMClassifier
+            Trained model to be exported.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.onnx_output_path), exist_ok=True)
+            logger.info("Exporting trained model to ONNX.")
+            initial_types = [("input", FloatTensorType([None, model.n_features_in_]))]
+            onnx_model = onnxmltools.convert_lightgbm(
+                model, initial_types=initial_types, zipmap=False
+            )
+            onnxmltools.utils.save_model(onnx_model, self.onnx_output_path)
+            logger.info(f"ONNX model successfully saved to: {self.onnx_output_path}")
+
+        except Exception as e:
+            logger.error(f"Error while exporting model to ONNX: {e}")
+            raise CustomException("Failed to export model to ONNX") from e
 
     # -------------------------------------------------------------------
     # Method: run
@@ -233,34 +500,67 @@ class ModelTraining:
     def run(self):
         """
         Executes the full model training pipeline with MLflow integration.
+
+        The train/test splits are logged by reference (`mlflow.log_input`:
+        source path, schema and digest) rather than uploaded. The model files
+        upload on a small thread pool while parameters and metrics are
+        logged; the fluent API's active run is thread-local, so the workers
+        log through an `MlflowClient` bound to the run id.
         """
         try:
-            with mlflow.start_run():
-                logger.info("🚀 Starting Model Training Pipeline")
-                logger.info("Initialising MLflow experiment tracking.")
+            logger.info("🚀 Starting Model Training Pipeline")
 
-                # Log training and test datasets as artefacts
-                logger.info("Logging datasets to MLflow.")
-                mlflow.log_artifact(self.train_path, artifact_path="datasets")
-                mlflow.log_artifact(self.test_path, artifact_path="datasets")
+            # Local file reads stay outside the MLflow run span
+            X_train, y_train, X_test, y_test = self.load_and_split_data()
 
-                # Load, train, and evaluate
-                X_train, y_train, X_test, y_test = self.load_and_split_data()
-                best_lgbm_model = self.train_lgbm(X_train, y_train)
+            with mlflow.start_run() as active_run, ThreadPoolExecutor(max_workers=4) as uploads:
+                logger.info("Initialising MLflow experiment tracking.")
+                client = MlflowClient()
+                run_id = active_run.info.run_id
+
+                # Log the datasets by reference (no upload)
+                logger.info("Logging dataset references to MLflow.")
+                for name, path, X, y in (
+                    ("train", self.train_path, X_train, y_train),
+                    ("test", self.test_path, X_test, y_test),
+                ):
+                    dataset = mlflow.data.from_pandas(
+                        X.assign(booking_status=y), source=path, targets="booking_status", name=name
+                    )
+                    mlflow.log_input(dataset, context="training" if name == "train" else "testing")
+
+                # Train and evaluate
+                best_lgbm_model, best_params = self.train_lgbm(X_train, y_train)
                 metrics = self.evaluate_model(best_lgbm_model, X_test, y_test)
                 self.save_model(best_lgbm_model)
+                self.export_onnx(best_lgbm_model)
 
                 # Log model and metrics
                 logger.info("Logging trained model and metrics to MLflow.")
-                mlflow.log_artifact(self.model_output_path)
-                mlflow.log_params(best_lgbm_model.get_params())
+                pending = [
+                    uploads.submit(client.log_artifact, run_id, path)
+                    for path in (self.model_output_path, self.onnx_output_path)
+                ]
+                # Log only the tuned values; everything else is fingerprinted
+                mlflow.log_params(best_params)
+                untuned = {
+                    k: v for k, v in best_lgbm_model.get_params().items() if k not in best_params
+                }
+                mlflow.set_tag(
+                    "lgbm_defaults_hash",
+                    hashlib.md5(json.dumps(sorted(untuned.items()), default=str).encode()).hexdigest()
+                )
                 mlflow.log_metrics(metrics)
 
+                # Surface any upload failure before the run is closed
+                for upload in pending:
+                    upload.result()
+
                 logger.info("✅ Model training pipeline completed successfully.")
 
         except Exception as e:
             logger.error(f"Error in model training pipeline: {e}")
-            raise CustomException("Failed during model training pipeline", e)
+            raise CustomException("Failed during model training pipeline") from e
 
 
 # -------------------------------------------------------------------
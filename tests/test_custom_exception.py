@@ -0,0 +1,120 @@
+"""
+Tests for the error location reported by `src.custom_exception.CustomException`.
+
+The location comes from the wrapped `cause`, the exception currently being
+handled, or the raising frame, in that order.
+"""
+
+import sys
+
+import pytest
+
+from src.custom_exception import CustomException
+
+HERE = __file__
+
+
+def _next_line() -> int:
+    """Line number of the statement after the caller's current line."""
+    return sys._getframe(1).f_lineno + 1
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+def _location(message: str, line: int) -> str:
+    return f"Error in {HERE}, line {line}: {message}"
+
+
+class _PlainSubclass(CustomException):
+    pass
+
+
+class _InitSubclass(CustomException):
+    def __init__(self, error_message: str):
+        super().__init__(f"wrapped: {error_message}")
+
+
+class _NestedSubclass(_InitSubclass):
+    def __init__(self, error_message: str, code: int):
+        self.code = code
+        super().__init__(error_message)
+
+
+def test_uses_exception_being_handled():
+    with pytest.raises(CustomException) as info:
+        try:
+            line = _next_line()
+            _fail()
+        except ValueError as e:
+            raise CustomException("failed") from e
+    assert str(info.value) == _location("failed", line)
+
+
+def test_explicit_cause_outside_except_block():
+    try:
+        line = _next_line()
+        _fail()
+    except ValueError as e:
+        error = e
+    exc = CustomException("failed", cause=error)
+    assert str(exc) == _location("failed", line)
+
+
+def test_explicit_cause_wins_over_exception_being_handled():
+    try:
+        line = _next_line()
+        _fail()
+    except ValueError as e:
+        cause = e
+    try:
+        _fail()
+    except ValueError:
+        exc = CustomException("failed", cause=cause)
+    assert str(exc) == _location("failed", line)
+
+
+def test_raised_outside_except_block_reports_raising_line():
+    with pytest.raises(CustomException) as info:
+        line = _next_line()
+        raise CustomException("bad input")
+    assert str(info.value) == _location("bad input", line)
+
+
+def test_plain_subclass_reports_raising_line():
+    with pytest.raises(_PlainSubclass) as info:
+        line = _next_line()
+        raise _PlainSubclass("bad input")
+    assert str(info.value) == _location("bad input", line)
+
+
+def test_subclass_init_is_skipped():
+    with pytest.raises(_InitSubclass) as info:
+        line = _next_line()
+        raise _InitSubclass("bad input")
+    assert str(info.value) == _location("wrapped: bad input", line)
+
+
+def test_nested_subclass_inits_are_skipped():
+    with pytest.raises(_NestedSubclass) as info:
+        line = _next_line()
+        raise _NestedSubclass("bad input", code=3)
+    assert str(info.value) == _location("wrapped: bad input", line)
+    assert info.value.code == 3
+
+
+def test_helper_wrapper_reports_its_raise():
+    def reject(message):
+        raise CustomException(message)
+
+    line = reject.__code__.co_firstlineno + 1
+    with pytest.raises(CustomException) as info:
+        reject("bad input")
+    assert str(info.value) == _location("bad input", line)
+
+
+def test_direct_formatter_call_reports_caller():
+    line = _next_line()
+    message = CustomException.get_detailed_error_message("bad input")
+    assert message == _location("bad input", line)
@@ -0,0 +1,56 @@
+"""
+Tests for the Numba F1 feval in `src.lgbm_metrics`.
+
+Scores must match `sklearn.metrics.f1_score` on predictions thresholded with
+a strict `> 0.5`, including when F1 is undefined (no positives at all).
+"""
+
+import lightgbm as lgb
+import numpy as np
+import pytest
+from sklearn.metrics import f1_score
+
+from src.lgbm_metrics import f1_feval
+
+
+def _feval(y_true, proba):
+    data = lgb.Dataset(np.zeros((len(y_true), 1)), label=np.asarray(y_true, dtype=np.float32))
+    return f1_feval(np.asarray(proba, dtype=np.float64), data)
+
+
+def _sklearn_f1(y_true, proba):
+    return f1_score(y_true, (np.asarray(proba) > 0.5).astype(int), zero_division=0)
+
+
+def test_returns_lightgbm_feval_tuple():
+    name, _, higher_is_better = _feval([0, 1], [0.2, 0.8])
+    assert name == "f1" and higher_is_better is True
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_sklearn_on_random_data(seed):
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, 1000)
+    proba = rng.random(1000)
+    assert _feval(y_true, proba)[1] == pytest.approx(_sklearn_f1(y_true, proba), abs=1e-12)
+
+
+@pytest.mark.parametrize(
+    "y_true, proba",
+    [
+        ([0, 0, 0], [0.1, 0.2, 0.3]),   # no positives, none predicted: 0/0
+        ([0, 0, 0], [0.9, 0.2, 0.7]),   # false positives only
+        ([1, 1, 0], [0.1, 0.2, 0.3]),   # false negatives only
+    ],
+)
+def test_zero_true_positives_score_zero(y_true, proba):
+    assert _feval(y_true, proba)[1] == _sklearn_f1(y_true, proba) == 0.0
+
+
+def test_probability_of_exactly_half_is_negative():
+    y_true = [1, 1, 0, 0]
+    proba = [0.5, 0.9, 0.5, 0.1]
+    # The 0.5 ties are predicted negative: tp=1, fp=0, fn=1
+    score = _feval(y_true, proba)[1]
+    assert score == pytest.approx(2 / 3)
+    assert score == pytest.approx(_sklearn_f1(y_true, proba))
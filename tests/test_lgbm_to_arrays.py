@@ -0,0 +1,64 @@
+"""
+Parity tests for the Numba tree-ensemble evaluator in `src.lgbm_to_arrays`.
+
+The evaluator must agree with `Booster.predict`, including for inputs that are
+not valid category codes (NaN, inf, negatives, values past the bitset).
+"""
+
+import lightgbm as lgb
+import numpy as np
+import pytest
+
+from src.lgbm_to_arrays import booster_to_arrays, predict_proba
+
+
+@pytest.fixture(scope="module")
+def booster():
+    rng = np.random.default_rng(0)
+    n = 2000
+    X = np.column_stack([
+        rng.integers(0, 40, n),        # categorical, several bitset words
+        rng.integers(0, 5, n),         # categorical, one word
+        rng.normal(size=n),            # numerical
+    ]).astype(np.float32)
+    logit = np.isin(X[:, 0], [0, 3, 7, 33]) * 2.0 - (X[:, 1] == 2) + X[:, 2]
+    y = (logit + rng.normal(scale=0.5, size=n) > 0.5).astype(int)
+    return lgb.train(
+        {"objective": "binary", "verbosity": -1, "num_leaves": 15, "min_data_per_group": 5,
+         "cat_smooth": 1.0, "max_cat_to_onehot": 1, "seed": 0},
+        lgb.Dataset(X, y, categorical_feature=[0, 1]),
+        num_boost_round=30,
+    )
+
+
+def test_model_has_categorical_splits(booster):
+    assert booster_to_arrays(booster).is_categorical.any()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [np.nan, np.inf, -np.inf, 1e50, 2.0 ** 63, 1e20, 3e9, 40.0, 1000.0,
+     -0.5, -0.999, -1.0, -5.0, 0.0, 0.7, 3.0, 33.0, 33.9],
+)
+def test_categorical_edge_values_match_booster(booster, value):
+    ensemble = booster_to_arrays(booster)
+    X = np.zeros((3, 3), dtype=np.float64)  # float64 keeps 1e50 finite
+    X[:, 2] = [-1.0, 0.0, 1.0]
+    for col in (0, 1):
+        rows = X.copy()
+        rows[:, col] = value
+        np.testing.assert_allclose(
+            predict_proba(rows, ensemble), booster.predict(rows), rtol=0, atol=1e-9
+        )
+
+
+def test_random_rows_match_booster(booster):
+    rng = np.random.default_rng(1)
+    X = np.column_stack([
+        rng.integers(-3, 60, 500), rng.integers(-3, 8, 500), rng.normal(size=500)
+    ]).astype(np.float32)
+    X[::7, 0] = np.nan
+    X[::11, 2] = np.nan
+    np.testing.assert_allclose(
+        predict_proba(X, booster_to_arrays(booster)), booster.predict(X), rtol=0, atol=1e-9
+    )
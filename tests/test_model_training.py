@@ -0,0 +1,122 @@
+"""
+Tests for the successive-halving search helpers in `src.model_training`.
+
+The rung count and the row-sampling constraints decide which candidates the
+search trains and on how much data, so their edge cases are pinned here.
+"""
+
+import lightgbm as lgb
+import numpy as np
+import pytest
+
+from src.model_training import _constrain_sampling, _n_halvings, _n_rungs
+
+
+# -------------------------------------------------------------------
+# _n_halvings / _n_rungs
+# -------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "n, factor, expected",
+    [
+        (0, 3, 0), (1, 3, 0), (2, 3, 0),
+        (3, 3, 1), (8, 3, 1), (9, 3, 2), (26, 3, 2), (27, 3, 3),
+        (0.99, 2, 0), (2.0, 2, 1), (1000, 10, 3), (999, 10, 2),
+    ],
+)
+def test_n_halvings_is_floor_log(n, factor, expected):
+    assert _n_halvings(n, factor) == expected
+
+
+@pytest.mark.parametrize("min_resources", [2000, 3000, 10_000])
+def test_single_rung_when_min_resources_covers_all_rows(min_resources):
+    assert _n_rungs(n_candidates=50, n_samples=2000, min_resources=min_resources, factor=3) == 1
+
+
+def test_single_rung_with_fewer_candidates_than_factor():
+    assert _n_rungs(n_candidates=2, n_samples=100_000, min_resources=100, factor=3) == 1
+
+
+@pytest.mark.parametrize(
+    "n_candidates, n_samples, expected",
+    [
+        (5, 18_000, 2),     # candidates limit: 5 -> 2 survivors
+        (9, 18_000, 3),     # candidates exactly factor**2
+        (8, 18_000, 2),     # one short of factor**2
+        (81, 6_000, 2),     # rows limit: exactly 2000 * 3
+        (81, 5_999, 1),     # one row short of a second rung
+        (81, 18_000, 3),    # rows exactly 2000 * 3**2
+    ],
+)
+def test_rung_count_at_factor_boundaries(n_candidates, n_samples, expected):
+    assert _n_rungs(n_candidates, n_samples, min_resources=2000, factor=3) == expected
+
+
+@pytest.mark.parametrize("factor", [2, 3, 4])
+@pytest.mark.parametrize("n_samples", [999, 5_000, 28_000, 100_003])
+def test_subsampled_rungs_stay_below_full_data(factor, n_samples):
+    min_resources = min(n_samples, max(2000, n_samples // 20))
+    n_rungs = _n_rungs(1000, n_samples, min_resources, factor)
+    # Every rung but the last trains on a strict subsample
+    for rung in range(n_rungs - 1):
+        assert min_resources * factor ** rung < n_samples
+
+
+# -------------------------------------------------------------------
+# _constrain_sampling
+# -------------------------------------------------------------------
+def test_bagging_candidate_drops_goss_rates():
+    params = _constrain_sampling(
+        {"data_sample_strategy": "bagging", "top_rate": 0.2, "other_rate": 0.1, "bagging_fraction": 0.7}
+    )
+    assert params == {"data_sample_strategy": "bagging", "bagging_fraction": 0.7}
+
+
+def test_default_strategy_is_treated_as_bagging():
+    assert _constrain_sampling({"top_rate": 0.2, "num_leaves": 31}) == {"num_leaves": 31}
+
+
+@pytest.mark.parametrize("key", ["bagging_fraction", "subsample", "sub_row", "bagging"])
+def test_goss_candidate_drops_bagging_fraction(key):
+    params = _constrain_sampling(
+        {"data_sample_strategy": "goss", key: 0.5, "bagging_freq": 1, "top_rate": 0.2}
+    )
+    assert key not in params
+    assert params["top_rate"] == 0.2
+
+
+def test_goss_rates_are_capped_at_one():
+    params = _constrain_sampling({"data_sample_strategy": "goss", "top_rate": 0.7, "other_rate": 0.5})
+    assert params["top_rate"] + params["other_rate"] == pytest.approx(1.0)
+    # Capping against the default top_rate when only other_rate is sampled
+    params = _constrain_sampling({"data_sample_strategy": "goss", "other_rate": 0.9})
+    assert params["other_rate"] == pytest.approx(0.8)
+
+
+def test_goss_rates_within_bound_are_kept():
+    params = {"data_sample_strategy": "goss", "top_rate": 0.3, "other_rate": 0.2}
+    assert _constrain_sampling(params) == params
+
+
+def test_input_is_not_mutated():
+    params = {"data_sample_strategy": "goss", "bagging_fraction": 0.5, "top_rate": 0.9, "other_rate": 0.5}
+    _constrain_sampling(params)
+    assert params == {"data_sample_strategy": "goss", "bagging_fraction": 0.5, "top_rate": 0.9, "other_rate": 0.5}
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"data_sample_strategy": "goss", "bagging_fraction": 0.5, "bagging_freq": 1},
+        {"data_sample_strategy": "goss", "subsample": 0.5, "subsample_freq": 1},
+        {"data_sample_strategy": "goss", "top_rate": 0.7, "other_rate": 0.5},
+    ],
+)
+def test_constrained_goss_candidates_train(params):
+    rng = np.random.default_rng(0)
+    X = rng.random((200, 3))
+    y = (X[:, 0] > 0.5).astype(int)
+    lgb.train(
+        {"objective": "binary", "verbosity": -1, **_constrain_sampling(params)},
+        lgb.Dataset(X, y),
+        num_boost_round=2,
+    )
@@ -0,0 +1,98 @@
+"""
+Request-validation tests for the `/predict_batch` endpoint in `app`.
+
+Every malformed payload must be refused with a 400 (or a 413 for oversized
+bodies) before it reaches the model; well-formed rows are scored.
+"""
+
+import pytest
+
+import app as app_module
+
+
+@pytest.fixture(scope="module")
+def client():
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def row():
+    return {name: 1 for name in app_module.FEATURE_NAMES}
+
+
+def _post(client, payload):
+    return client.post("/predict_batch", json=payload)
+
+
+def test_keyed_rows_are_scored(client, row):
+    response = _post(client, {"rows": [row, dict(row, lead_time=300)]})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert len(body["predictions"]) == len(body["probabilities"]) == 2
+
+
+def test_rows_are_matched_by_name_not_position(client, row):
+    reordered = dict(reversed(list(row.items())))
+    first = _post(client, {"rows": [row]}).get_json()
+    second = _post(client, {"rows": [reordered]}).get_json()
+    assert first == second
+
+
+@pytest.mark.parametrize("payload", [None, [1], {"data": []}, {"rows": 5}])
+def test_malformed_body_is_rejected(client, payload):
+    assert _post(client, payload).status_code == 400
+
+
+def test_positional_rows_are_rejected(client):
+    response = _post(client, {"rows": [[1] * app_module.N_FEATURES]})
+    assert response.status_code == 400
+    assert "row 0" in response.get_json()["error"]
+
+
+def test_missing_feature_is_named(client, row):
+    del row["lead_time"]
+    response = _post(client, {"rows": [row]})
+    assert response.status_code == 400
+    assert "missing features ['lead_time']" in response.get_json()["error"]
+
+
+def test_unknown_feature_is_named(client, row):
+    response = _post(client, {"rows": [dict(row, extra=1)]})
+    assert response.status_code == 400
+    assert "unknown features ['extra']" in response.get_json()["error"]
+
+
+@pytest.mark.parametrize("value", [True, False, "5", None, [1]])
+def test_non_numeric_value_is_rejected(client, row, value):
+    response = _post(client, {"rows": [row, dict(row, lead_time=value)]})
+    assert response.status_code == 400
+    assert "row 1 feature 'lead_time'" in response.get_json()["error"]
+
+
+@pytest.mark.parametrize("value", [1e39, -1e50, 10 ** 400])
+def test_values_past_float32_range_are_rejected(client, row, value):
+    response = _post(client, {"rows": [dict(row, avg_price_per_room=value)]})
+    assert response.status_code == 400
+    assert "finite" in response.get_json()["error"]
+
+
+def test_non_finite_json_constants_are_rejected(client):
+    body = "{\"rows\": [{%s}]}" % ", ".join(
+        f"\"{name}\": {'NaN' if i == 0 else 1}" for i, name in enumerate(app_module.FEATURE_NAMES)
+    )
+    response = client.post("/predict_batch", data=body, content_type="application/json")
+    assert response.status_code == 400
+
+
+def test_row_limit(client, row, monkeypatch):
+    monkeypatch.setattr(app_module, "MAX_BATCH_ROWS", 2)
+    assert _post(client, {"rows": [row] * 2}).status_code == 200
+    response = _post(client, {"rows": [row] * 3})
+    assert response.status_code == 400
+    assert "At most 2 rows" in response.get_json()["error"]
+
+
+def test_oversized_body_is_refused(client):
+    body = b" " * (app_module.MAX_REQUEST_BYTES + 1)
+    response = client.post("/predict_batch", data=body, content_type="application/json")
+    assert response.status_code == 413
@@ -5,7 +5,8 @@ Shared utility functions for configuration loading and dataset IO.
 
 This module provides:
 1) `read_yaml` - reads YAML configuration (defaults to `config/config.yaml`).
-2) `load_data` - loads CSV datasets into pandas DataFrames.
+2) `load_data` - loads CSV or Parquet datasets into pandas DataFrames.
+3) `downcast_dtypes` - picks compact numeric dtypes for a DataFrame.
 
 The functions integrate with the project-wide logger and raise
 `CustomException` for consistent, descriptive error handling.
@@ -16,7 +17,7 @@ Example:
     from utils.common_functions import read_yaml, load_data
 
     cfg = read_yaml()  # uses CONFIG_PATH from config/paths_config.py
-    df  = load_data("artifacts/raw/train.csv")
+    df  = load_data("artifacts/raw/train.parquet")
 
 Notes
 -----
@@ -28,19 +29,28 @@ Notes
 # Standard Library Imports
 # -------------------------------------------------------------------
 import os
+from functools import lru_cache
 
 # -------------------------------------------------------------------
 # Third-Party Imports
 # -------------------------------------------------------------------
+import numpy as np
 import yaml
 import pandas as pd
+import pyarrow.csv as pacsv
+
+# libyaml's C safe loader when PyYAML was built with it (manylinux wheels are)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader
 
 # -------------------------------------------------------------------
 # Internal Imports
 # -------------------------------------------------------------------
 from src.logger import get_logger
 from src.custom_exception import CustomException
-from config.paths_config import CONFIG_PATH 
+from config.paths_config import CONFIG_PATH
 
 # -------------------------------------------------------------------
 # Logger Setup
@@ -51,10 +61,22 @@ logger = get_logger(__name__)
 # -------------------------------------------------------------------
 # Function: read_yaml
 # -------------------------------------------------------------------
+@lru_cache(maxsize=8)
+def _parse_yaml(file_path: str, mtime: float) -> dict:
+    """Parse a YAML file; memoised per path and modification time."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
 def read_yaml(file_path: str = CONFIG_PATH) -> dict:
     """
     Read a YAML configuration file and return its contents as a dictionary.
 
+    Parsed contents are cached per path and modification time, so repeated
+    reads (e.g. re-creating pipeline components) skip the YAML parse while
+    edits to the file are still picked up. The returned dict is shared
+    between callers and must not be mutated.
+
     Parameters
     ----------
     file_path : str, optional
@@ -72,20 +94,27 @@ def read_yaml(file_path: str = CONFIG_PATH) -> dict:
         If the file does not exist or cannot be parsed.
     """
     try:
-        # Validate file existence
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Config file not found at path: {file_path}")
+        # Validate file existence; the mtime stat doubles as the check
+        try:
+            mtime = os.path.getmtime(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found at path: {file_path}") from None
 
         # Read YAML with UTF-8 encoding
-        with open(file_path, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f) or {}
-            logger.info(f"Successfully read YAML config: {file_path}")
-            return cfg
+        cfg = _parse_yaml(file_path, mtime)
+        logger.info(f"Successfully read YAML config: {file_path}")
+        return cfg
 
     except Exception as e:
         logger.error(f"Error while reading YAML file '{file_path}': {e}")
-        import sys
-        raise CustomException("Failed to read YAML configuration", sys) from e
+        raise CustomException("Failed to read YAML configuration") from e
+
+
+# -------------------------------------------------------------------
+# CSV Reader Options
+# -------------------------------------------------------------------
+# Parse CSVs on all cores in 32 MB blocks
+_CSV_READ_OPTIONS = pacsv.ReadOptions(use_threads=True, block_size=32 << 20)
 
 
 # -------------------------------------------------------------------
@@ -93,12 +122,17 @@ def read_yaml(file_path: str = CONFIG_PATH) -> dict:
 # -------------------------------------------------------------------
 def load_data(csv_path: str) -> pd.DataFrame:
     """
-    Load a CSV file into a pandas DataFrame.
+    Load a CSV or Parquet file into a pandas DataFrame.
+
+    The format is chosen from the file extension: `.parquet` files are read
+    with pyarrow, anything else is parsed as CSV by pyarrow's multithreaded
+    reader. Both are converted to NumPy-backed pandas columns, as
+    `pd.read_csv` would produce.
 
     Parameters
     ----------
     csv_path : str
-        Path to the CSV file.
+        Path to the CSV or Parquet file.
 
     Returns
     -------
@@ -112,11 +146,48 @@ def load_data(csv_path: str) -> pd.DataFrame:
     """
     try:
         logger.info(f"Loading data from: {csv_path}")
-        df = pd.read_csv(csv_path)
+        if csv_path.endswith(".parquet"):
+            df = pd.read_parquet(csv_path, engine="pyarrow")
+        else:
+            table = pacsv.read_csv(csv_path, read_options=_CSV_READ_OPTIONS)
+            df = table.to_pandas()
         logger.info(f"Data loaded successfully: shape={df.shape}")
         return df
 
     except Exception as e:
         logger.error(f"Error while loading data from '{csv_path}': {e}")
-        import sys
-        raise CustomException("Failed to load data", sys) from e
\ No newline at end of file
+        raise CustomException("Failed to load data") from e
+
+
+# -------------------------------------------------------------------
+# Function: downcast_dtypes
+# -------------------------------------------------------------------
+def downcast_dtypes(df: pd.DataFrame) -> dict:
+    """
+    Map each wide numeric column to its narrowest lossless-enough dtype.
+
+    Integers (int32/int64) get the smallest signed type holding their range
+    (as `pd.to_numeric(downcast="integer")` would pick); float64 columns
+    become float32.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame whose columns are inspected.
+
+    Returns
+    -------
+    dict
+        Column name to target dtype, suitable for `DataFrame.astype`.
+    """
+    dtypes = {c: np.float32 for c in df.select_dtypes("float64").columns}
+    int_cols = df.select_dtypes(["int32", "int64"]).columns
+    if len(int_cols):
+        bounds = df[int_cols].agg(["min", "max"])
+        for col in int_cols:
+            lo, hi = bounds.at["min", col], bounds.at["max", col]
+            dtypes[col] = next(
+                (t for t in (np.int8, np.int16, np.int32) if np.iinfo(t).min <= lo and hi <= np.iinfo(t).max),
+                np.int64,
+            )
+    return dtypes